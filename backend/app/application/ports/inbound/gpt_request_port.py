@@ -5,7 +5,7 @@ from app.domain.models.gpt_response import GPTResponse
 
 DEFAULT_MAX_TOKENS = 100
 
-@dataclass
+@dataclass(slots=True)
 class SubmitRequestCommand:
     """Command object for submitting GPT requests"""
     prompt: str
@@ -28,6 +28,7 @@ class GPTRequestPort(Protocol):
     Inbound port for handling GPT request operations.
     This port defines the interface for submitting requests to the GPT service.
     """
+    __slots__ = ()
 
     async def submit_request(self, command: SubmitRequestCommand) -> GPTResponse:
         """
@@ -4,7 +4,7 @@ from datetime import datetime
 from app.domain.models.gpt_request import GPTRequest
 from app.domain.models.gpt_response import GPTResponse
 
-@dataclass
+@dataclass(slots=True)
 class ConversationEntry:
     """A single conversation exchange between user and GPT"""
     user_id: str
@@ -12,7 +12,7 @@ class ConversationEntry:
     response: GPTResponse
     timestamp: datetime
 
-@dataclass
+@dataclass(slots=True)
 class ConversationQuery:
     """Query parameters for retrieving conversation history"""
     user_id: str
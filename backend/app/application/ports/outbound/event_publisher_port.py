@@ -0,0 +1,17 @@
+from typing import Any, Optional, Protocol
+
+class EventPublisherPort(Protocol):
+    """
+    Outbound port for publishing domain events.
+    Use cases depend on this interface rather than a concrete event bus.
+    """
+
+    def publish(self, event: Any, data: Optional[dict] = None) -> None:
+        """
+        Publish an event to any interested subscribers.
+
+        Args:
+            event: The event to publish
+            data: Optional payload accompanying the event
+        """
+        ...
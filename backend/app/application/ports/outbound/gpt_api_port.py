@@ -2,7 +2,7 @@ from typing import Protocol
 from dataclasses import dataclass
 from app.domain.models.gpt_response import GPTResponse
 
-@dataclass
+@dataclass(slots=True)
 class GPTAPIRequest:
     """Data structure for GPT API requests"""
     prompt: str
@@ -6,10 +6,11 @@ the domain models and infrastructure-level cache adapters.
 """
 
 import hashlib
-import json
 from datetime import datetime
 from typing import Any, Dict, Generic, Optional, Type, TypeVar, Union
 
+import orjson
+
 from app.domain.models.cached_response import CachedResponse
 from app.infrastructure.adapters.cache.cache_adapter import CacheAdapter
 
@@ -134,17 +135,20 @@ class CacheService:
         Returns:
             A string key for use with the cache
         """
-        # Convert the data to a string representation
+        # Convert the data to a byte representation
         if isinstance(data, str):
-            data_str = data
+            data_bytes = data.encode('utf-8')
         else:
-            try:
-                data_str = json.dumps(data, sort_keys=True)
-            except (TypeError, ValueError):
-                data_str = str(data)
+            # Sorted keys (non-string keys included) keep the hash independent
+            # of dict insertion order; unserializable values fall back to str()
+            data_bytes = orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
 
         # Create a hash of the data
-        data_hash = hashlib.md5(data_str.encode('utf-8')).hexdigest()
+        data_hash = hashlib.md5(data_bytes).hexdigest()
 
         # Combine the prefix and hash to form the key
         return f"{prefix}:{data_hash}"
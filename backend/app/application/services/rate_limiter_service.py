@@ -22,12 +22,18 @@ class RateLimiterService:
     abstracting away the details of the underlying rate limiter implementation.
     """
 
-    def __init__(self, rate_limiter: RateLimiter):
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        limits_override: Optional[Dict[str, Dict[str, int]]] = None
+    ):
         """
         Initialize the rate limiter service.
 
         Args:
             rate_limiter: The underlying rate limiter adapter implementation to use
+            limits_override: Per-resource limits that replace the defaults, keyed by
+                resource type, e.g. {'api': {'max_requests': 1, 'window_seconds': 60}}
         """
         self._rate_limiter = rate_limiter
 
@@ -42,6 +48,8 @@ class RateLimiterService:
                 'window_seconds': 60
             }
         }
+        if limits_override:
+            self._default_limits.update(limits_override)
 
     def check_and_update(self, key: str, resource_type: str = 'api') -> RateLimitResult:
         """
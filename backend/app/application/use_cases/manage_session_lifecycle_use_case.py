@@ -2,13 +2,13 @@ from dataclasses import dataclass
 from typing import Dict, Optional, Protocol
 from app.domain.models.user_context import UserContext
 
-@dataclass
+@dataclass(slots=True)
 class CreateSessionCommand:
     """Command for creating a new user session"""
     user_id: str
     preferences: Dict[str, str]
 
-@dataclass
+@dataclass(slots=True)
 class UpdateSessionCommand:
     """Command for updating an existing session"""
     user_id: str
@@ -25,6 +25,7 @@ class ManageSessionLifecycleUseCase:
     Use case for managing user session lifecycle, including creation,
     updates, and termination.
     """
+    __slots__ = ("session_repository",)
 
     def __init__(self, session_repository: SessionRepository):
         self.session_repository = session_repository
@@ -5,20 +5,22 @@ from app.application.ports.outbound.conversation_persistence_port import (
     ConversationPersistencePort,
     ConversationQuery
 )
+from app.application.ports.outbound.event_publisher_port import EventPublisherPort
 
 class ProcessResponseUseCase:
     """
     Use case for processing GPT responses, including any post-processing,
     validation, and event emission.
     """
+    __slots__ = ("persistence", "_publish")
 
     def __init__(
         self,
         persistence: ConversationPersistencePort,
-        event_publisher: Optional[callable] = None
+        event_bus: Optional[EventPublisherPort] = None
     ):
         self.persistence = persistence
-        self.event_publisher = event_publisher or (lambda x: None)
+        self._publish = event_bus.publish if event_bus else (lambda *args, **kwargs: None)
 
     async def process_response(self, response: GPTResponse) -> GPTResponse:
         """
@@ -48,6 +50,6 @@ class ProcessResponseUseCase:
         # For now, we'll keep it simple
 
         # Emit response received event
-        self.event_publisher(ResponseReceivedEvent(response=response))
+        self._publish(ResponseReceivedEvent(response=response))
 
         return response
@@ -6,6 +6,7 @@ from app.application.ports.outbound.conversation_persistence_port import (
     ConversationPersistencePort,
     ConversationEntry
 )
+from app.application.ports.outbound.event_publisher_port import EventPublisherPort
 from app.domain.models.gpt_request import GPTRequest
 from app.domain.models.gpt_response import GPTResponse
 from app.domain.events.request_events import RequestInitiatedEvent, RequestCompletedEvent
@@ -15,16 +16,18 @@ class SubmitRequestUseCase(GPTRequestPort):
     Use case for submitting GPT requests and handling responses.
     Implements the inbound GPTRequestPort interface.
     """
+    __slots__ = ("gpt_api", "persistence", "_publish")
 
     def __init__(
         self,
         gpt_api: GPTAPIPort,
         persistence: ConversationPersistencePort,
-        event_publisher: Optional[callable] = None
+        event_bus: Optional[EventPublisherPort] = None
     ):
         self.gpt_api = gpt_api
         self.persistence = persistence
-        self.event_publisher = event_publisher or (lambda x: None)  # No-op if no publisher provided
+        # Bind publish once so each event is a single bound-method call
+        self._publish = event_bus.publish if event_bus else (lambda *args, **kwargs: None)  # No-op if no bus provided
 
     async def submit_request(self, command: SubmitRequestCommand) -> GPTResponse:
         """
@@ -53,7 +56,7 @@ class SubmitRequestUseCase(GPTRequestPort):
         )
 
         # Emit request initiated event
-        self.event_publisher(RequestInitiatedEvent(request=request))
+        self._publish(RequestInitiatedEvent(request=request))
 
         # Call GPT API
         api_request = GPTAPIRequest(
@@ -73,7 +76,7 @@ class SubmitRequestUseCase(GPTRequestPort):
         await self.persistence.save_conversation(entry)
 
         # Emit completion event
-        self.event_publisher(RequestCompletedEvent(
+        self._publish(RequestCompletedEvent(
             request=request,
             response=response
         ))
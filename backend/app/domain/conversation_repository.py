@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 
 class ConversationRepository:
     """
@@ -10,7 +10,7 @@ class ConversationRepository:
         # In-memory storage for conversations
         self._storage: Dict[str, Any] = {}
 
-    def get_conversation(self, conversation_id: str) -> Optional[dict]:
+    async def get_conversation(self, conversation_id: str) -> Optional[dict]:
         """
         Retrieve a conversation by ID.
 
@@ -22,7 +22,35 @@ class ConversationRepository:
         """
         return self._storage.get(conversation_id)
 
-    def save_conversation(self, conversation_id: str, data: dict) -> None:
+    async def get_or_create(self, conversation_id: str) -> dict:
+        """
+        Retrieve a conversation by ID, creating an empty one if it does not exist.
+
+        Args:
+            conversation_id: The unique identifier for the conversation
+
+        Returns:
+            The stored conversation data
+        """
+        conversation = self._storage.get(conversation_id)
+        if conversation is None:
+            conversation = self._storage[conversation_id] = {"id": conversation_id, "messages": []}
+        return conversation
+
+    async def get_conversations_by_user(self, user_id: str) -> List[dict]:
+        """
+        Retrieve all conversations belonging to a user.
+
+        Args:
+            user_id: The unique identifier for the user
+
+        Returns:
+            The user's conversations, in creation order
+        """
+        return [conversation for conversation in self._storage.values()
+                if conversation.get("user_id") == user_id]
+
+    async def save_conversation(self, conversation_id: str, data: dict) -> None:
         """
         Save conversation data.
 
@@ -32,7 +60,7 @@ class ConversationRepository:
         """
         self._storage[conversation_id] = data
 
-    def create_session(self, session_data: dict) -> dict:
+    async def create_session(self, session_data: dict) -> dict:
         """
         Create a new conversation session.
 
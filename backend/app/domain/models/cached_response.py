@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Any, Dict, Optional, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedResponse:
     """
     Domain model representing a cached response.
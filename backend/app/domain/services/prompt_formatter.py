@@ -8,7 +8,6 @@ truncation, and few-shot examples.
 
 from typing import List, Dict, Any, Optional, Protocol, runtime_checkable
 from typing_extensions import TypedDict
-import re
 import logging
 from app.domain.models.user_context import UserContext
 from dataclasses import dataclass
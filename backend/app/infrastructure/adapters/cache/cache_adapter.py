@@ -6,12 +6,16 @@ used throughout the application to improve performance and reduce unnecessary
 API calls to the GPT service.
 """
 
-import json
+import logging
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Dict, Optional, Union
 
+import msgpack
+
+logger = logging.getLogger(__name__)
+
 
 class CacheAdapter(ABC):
     """
@@ -127,8 +131,7 @@ class InMemoryCacheAdapter(CacheAdapter):
         Args:
             key: The cache key to remove
         """
-        if key in self._cache:
-            del self._cache[key]
+        self._cache.pop(key, None)
 
     def clear(self) -> None:
         """
@@ -144,8 +147,15 @@ class RedisCacheAdapter(CacheAdapter):
     This implementation uses Redis as the underlying cache store.
     It's suitable for distributed environments where cache needs
     to be shared across multiple instances of the application.
+
+    Values are serialized with MessagePack, which is both faster to encode
+    and decode than JSON and produces a smaller payload on the wire. Keys are
+    stored under the KEY_PREFIX namespace so entries written by the earlier
+    JSON-encoding adapter are never read back as MessagePack.
     """
 
+    KEY_PREFIX = "msgpack:"
+
     def __init__(self, redis_client):
         """
         Initialize the Redis cache adapter.
@@ -155,6 +165,10 @@ class RedisCacheAdapter(CacheAdapter):
         """
         self.redis = redis_client
 
+    def _key(self, key: str) -> str:
+        """Namespace a cache key for the MessagePack payload format"""
+        return f"{self.KEY_PREFIX}{key}"
+
     def get(self, key: str) -> Any:
         """
         Retrieve a value from the Redis cache.
@@ -165,16 +179,17 @@ class RedisCacheAdapter(CacheAdapter):
         Returns:
             The cached value if found, None otherwise
         """
-        value = self.redis.get(key)
+        value = self.redis.get(self._key(key))
         if value is None:
             return None
 
-        # Deserialize the JSON-encoded value
+        # Deserialize the MessagePack-encoded value
         try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            # If it's not JSON, return the raw value
-            return value
+            return msgpack.unpackb(value, raw=False)
+        except (ValueError, TypeError):
+            # An undecodable payload is treated as a miss rather than returned raw
+            logger.warning(f"Discarding undecodable cache value for key {key}")
+            return None
 
     def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
         """
@@ -185,13 +200,13 @@ class RedisCacheAdapter(CacheAdapter):
             value: The value to store
             ttl_seconds: Optional time-to-live in seconds after which the value expires
         """
-        # Serialize the value as JSON
-        serialized_value = json.dumps(value)
+        # Serialize the value as MessagePack
+        serialized_value = msgpack.packb(value, use_bin_type=True)
 
         if ttl_seconds is not None:
-            self.redis.setex(key, int(ttl_seconds), serialized_value)
+            self.redis.setex(self._key(key), int(ttl_seconds), serialized_value)
         else:
-            self.redis.set(key, serialized_value)
+            self.redis.set(self._key(key), serialized_value)
 
     def delete(self, key: str) -> None:
         """
@@ -200,7 +215,7 @@ class RedisCacheAdapter(CacheAdapter):
         Args:
             key: The cache key to remove
         """
-        self.redis.delete(key)
+        self.redis.delete(self._key(key))
 
     def clear(self) -> None:
         """
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 class GPTAPIAdapter:
     """
     Adapter for GPT API service.
@@ -12,7 +14,7 @@ class GPTAPIAdapter:
         # Process the request and return a stub response
         return "stub response"
 
-    def process_request(self, prompt: str) -> str:
+    def process_request(self, prompt: str) -> Dict[str, Any]:
         """
         Process a request through the GPT API.
 
@@ -20,7 +22,12 @@ class GPTAPIAdapter:
             prompt: The user's input prompt
 
         Returns:
-            The generated response from GPT
+            The generated text with its token usage and finish reason
         """
-        # For now, just return a stub response
-        return f"This is a stub response to: {prompt}"
+        # For now, just return a stub response; usage is a whitespace word count
+        text = f"This is a stub response to: {prompt}"
+        return {
+            "text": text,
+            "tokens_used": len(prompt.split()) + len(text.split()),
+            "finish_reason": "stop"
+        }
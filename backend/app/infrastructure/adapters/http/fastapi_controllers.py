@@ -1,11 +1,24 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
-from app.infrastructure.container import Container
+from typing import Annotated, List, Dict, Any, Optional
+from app.domain.conversation_repository import ConversationRepository
+from app.use_cases.submit_request_use_case import SubmitRequestUseCase
 
 # Create API router
 router = APIRouter()
 
+# --- Dependencies ---
+def get_submit_request_use_case(request: Request):
+    """Return the submit request use case resolved during application startup"""
+    return request.app.state.submit_request_use_case
+
+def get_conversation_repository(request: Request):
+    """Return the conversation repository resolved during application startup"""
+    return request.app.state.conversation_repository
+
+SubmitRequestUseCaseDep = Annotated[SubmitRequestUseCase, Depends(get_submit_request_use_case)]
+ConversationRepositoryDep = Annotated[ConversationRepository, Depends(get_conversation_repository)]
+
 # --- Models ---
 class PromptRequest(BaseModel):
     prompt: str
@@ -23,10 +36,12 @@ async def health_check():
     return {"status": "healthy"}
 
 @router.post("/api/v1/gpt/prompt")
-async def submit_prompt(request: PromptRequest):
+async def submit_prompt(
+    request: PromptRequest,
+    use_case: SubmitRequestUseCaseDep
+):
     """Submit a prompt to GPT model"""
     try:
-        use_case = Container.submit_request_use_case()
         result = await use_case.execute({
             "prompt": request.prompt,
             "user_id": request.user_id,
@@ -45,10 +60,12 @@ async def submit_prompt(request: PromptRequest):
         )
 
 @router.post("/api/v1/session", status_code=201)
-async def create_session(request: SessionRequest):
+async def create_session(
+    request: SessionRequest,
+    repository: ConversationRepositoryDep
+):
     """Create a new conversation session"""
     try:
-        repository = Container.conversation_repository()
         session_data = {
             "user_id": request.user_id,
             "preferences": request.preferences
@@ -67,10 +84,12 @@ async def create_session(request: SessionRequest):
         )
 
 @router.get("/api/v1/history/{user_id}")
-async def get_history(user_id: str):
+async def get_history(
+    user_id: str,
+    repository: ConversationRepositoryDep
+):
     """Get conversation history for a user"""
     try:
-        repository = Container.conversation_repository()
         conversations = await repository.get_conversations_by_user(user_id)
 
         return {
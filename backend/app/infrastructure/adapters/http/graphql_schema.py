@@ -1,4 +1,5 @@
 import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
 from typing import List, Dict, Any, Optional
 from dependency_injector.wiring import Provide, inject
 from app.infrastructure.container import Container
@@ -24,21 +25,29 @@ class Conversation:
 class GPTResponseType:
     """Response from the GPT model"""
     text: str
-    tokens_used: int = strawberry.field(name="tokensUsed")
-    finish_reason: str | None = strawberry.field(name="finishReason", default=None)
+    tokens_used: int
+    finish_reason: str | None = None
 
 @strawberry.input(name="GPTRequestInput")
 class GPTRequestInput:
     """Input for a GPT request"""
     prompt: str
-    user_id: str = strawberry.field(name="userId")
+    user_id: str
     conversation_id: Optional[str] = "default"
 
 @strawberry.input(name="SessionInput")
 class SessionInput:
     """Input for creating a new session"""
     name: Optional[str] = None
-    user_id: str = strawberry.field(name="userId")
+    user_id: str
+
+def _to_conversation(conversation: Dict[str, Any]) -> Conversation:
+    """Map a repository conversation dict onto the GraphQL Conversation type"""
+    return Conversation(
+        id=conversation["id"],
+        messages=[Message(role=msg["role"], content=msg["content"])
+                  for msg in conversation.get("messages", ())]
+    )
 
 # Query and Mutations
 @strawberry.type(name="Query")
@@ -52,11 +61,7 @@ class Query:
             # Return empty conversation if not found
             return Conversation(id=conversation_id, messages=[])
 
-        return Conversation(
-            id=conversation["id"],
-            messages=[Message(role=msg["role"], content=msg["content"])
-                     for msg in conversation.get("messages", [])]
-        )
+        return _to_conversation(conversation)
 
 @strawberry.type(name="Mutation")
 class Mutation:
@@ -85,14 +90,12 @@ class Mutation:
         }
         conversation = await repository.create_session(session_data)
 
-        return Conversation(
-            id=conversation["id"],
-            messages=[Message(role=msg["role"], content=msg["content"])
-                     for msg in conversation.get("messages", [])]
-        )
+        return _to_conversation(conversation)
 
-# Schema instance
+# Schema instance; parsed and validated documents are cached so repeated
+# operations skip re-lexing and re-validation
 schema = strawberry.Schema(
     query=Query,
-    mutation=Mutation
+    mutation=Mutation,
+    extensions=[ParserCache(maxsize=128), ValidationCache(maxsize=128)]
 )
@@ -11,9 +11,7 @@ class ConversationRepository(ConversationPersistencePort):
 
     async def save_conversation(self, user_id: str, request: GPTRequest, response: GPTResponse) -> None:
         """Save a conversation exchange to the repository."""
-        if user_id not in self._conversations:
-            self._conversations[user_id] = []
-        self._conversations[user_id].append((request, response))
+        self._conversations.setdefault(user_id, []).append((request, response))
 
     async def get_conversation_history(self, user_id: str, limit: Optional[int] = None) -> List[tuple[GPTRequest, GPTResponse]]:
         """Retrieve conversation history for a user."""
@@ -24,5 +22,4 @@ class ConversationRepository(ConversationPersistencePort):
 
     async def clear_conversation_history(self, user_id: str) -> None:
         """Clear conversation history for a user."""
-        if user_id in self._conversations:
-            del self._conversations[user_id]
+        self._conversations.pop(user_id, None)
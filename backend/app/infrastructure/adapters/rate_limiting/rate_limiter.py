@@ -9,7 +9,6 @@ import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple, Any
-import json
 
 from app.domain.models.rate_limit_quota import RateLimitQuota, RateLimitResult
 
@@ -103,6 +102,11 @@ class InMemoryRateLimiter(RateLimiter):
         # Structure: {key: {'count': int, 'reset_at': float (timestamp)}}
         self._limits: Dict[str, Dict[str, Any]] = {}
 
+    @staticmethod
+    def _limit_key(key: str, max_requests: int, window_seconds: int) -> str:
+        """Build the storage key for a rate limit key and its limit settings"""
+        return f"{key}:{max_requests}:{window_seconds}"
+
     def check_limit(self, key: str, max_requests: int, window_seconds: int) -> RateLimitResult:
         """
         Check if the rate limit has been exceeded, and increment the counter if allowed.
@@ -116,7 +120,7 @@ class InMemoryRateLimiter(RateLimiter):
             A RateLimitResult indicating whether the request is allowed and quota information
         """
         now = time.time()
-        limit_key = f"{key}:{max_requests}:{window_seconds}"
+        limit_key = self._limit_key(key, max_requests, window_seconds)
 
         # Initialize or get the current limit record
         if limit_key not in self._limits:
@@ -171,7 +175,7 @@ class InMemoryRateLimiter(RateLimiter):
             The current RateLimitQuota for the key
         """
         now = time.time()
-        limit_key = f"{key}:{max_requests}:{window_seconds}"
+        limit_key = self._limit_key(key, max_requests, window_seconds)
 
         # If no limit record exists, return a fresh quota
         if limit_key not in self._limits:
@@ -221,6 +225,12 @@ class InMemoryRateLimiter(RateLimiter):
         for limit_key in keys_to_reset:
             self._limits[limit_key]['count'] = 0
 
+    def clear(self) -> None:
+        """
+        Clear all recorded usage for every key.
+        """
+        self._limits.clear()
+
 
 class RedisRateLimiter(RateLimiter):
     """
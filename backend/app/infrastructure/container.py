@@ -1,5 +1,8 @@
 from dependency_injector import containers, providers
 from app.application.use_cases.submit_request_use_case import SubmitRequestUseCase
+from app.use_cases.submit_request_use_case import (
+    SubmitRequestUseCase as ConversationSubmitRequestUseCase,
+)
 from app.application.use_cases.process_response_use_case import ProcessResponseUseCase
 from app.application.use_cases.manage_session_lifecycle_use_case import ManageSessionLifecycleUseCase
 from app.application.services.cache_service import CacheService
@@ -9,7 +12,10 @@ from app.infrastructure.adapters.gpt.gpt_api_adapter import GPTAPIAdapter
 from app.infrastructure.adapters.cache.cache_adapter import InMemoryCacheAdapter, RedisCacheAdapter
 from app.infrastructure.adapters.rate_limiting.rate_limiter import InMemoryRateLimiter, RedisRateLimiter
 from app.infrastructure.event_bus import EventBus
-from app.domain.conversation_repository import ConversationRepository  # New import
+from app.infrastructure.security.encryption import EncryptionService
+from app.domain.conversation_repository import (
+    ConversationRepository as DomainConversationRepository,
+)
 
 class Container(containers.DeclarativeContainer):
     """IoC container for dependency injection."""
@@ -18,7 +24,11 @@ class Container(containers.DeclarativeContainer):
 
     # Core services
     event_bus = providers.Singleton(EventBus)
-    event_publisher = providers.Factory(lambda event_bus: event_bus.publish, event_bus=event_bus)
+    encryption_service = providers.Singleton(
+        EncryptionService,
+        fernet_key=config.fernet_key,
+        ecc_private_key_pem=config.ecc_private_key_pem
+    )
 
     # Cache components
     cache_adapter = providers.Factory(
@@ -50,20 +60,17 @@ class Container(containers.DeclarativeContainer):
 
     # Adapters
     gpt_service = providers.Singleton(GPTAPIAdapter)
-    conversation_repository = providers.Singleton(ConversationRepository)
+    conversation_repository = providers.Singleton(DomainConversationRepository)
 
     # Use cases
     submit_request_use_case = providers.Singleton(
-        SubmitRequestUseCase,
+        ConversationSubmitRequestUseCase,
         gpt_service=gpt_service,
         conversation_repository=conversation_repository
     )
 
     # Infrastructure adapters
-    persistence = providers.Singleton(
-        ConversationRepository,
-        event_bus=event_bus
-    )
+    persistence = providers.Singleton(ConversationRepository)
 
     gpt_api = providers.Singleton(
         GPTAPIAdapter,
@@ -78,14 +85,13 @@ class Container(containers.DeclarativeContainer):
         SubmitRequestUseCase,
         gpt_api=gpt_api,
         persistence=persistence,
-        event_publisher=event_publisher
+        event_bus=event_bus
     )
 
     process_use_case = providers.Factory(
         ProcessResponseUseCase,
         persistence=persistence,
-        event_publisher=event_publisher,
-        cache_service=cache_service
+        event_bus=event_bus
     )
 
     session_use_case = providers.Factory(
@@ -1,15 +1,16 @@
-# ...existing code...
+from typing import Any, Optional
+
+
 class EventBus:
     """
     Stub implementation for EventBus.
 
     This event bus is used for publishing and subscribing to events.
     """
-    def publish(self, event: str, data: dict) -> None:
+    def publish(self, event: Any, data: Optional[dict] = None) -> None:
         # Stub publish method
         pass
 
     def subscribe(self, event: str, handler) -> None:
         # Stub subscribe method
         pass
-# ...existing code...
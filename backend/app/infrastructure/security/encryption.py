@@ -1,36 +1,112 @@
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric import x25519
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from nacl.secret import SecretBox
 from nacl.utils import random
 import base64
-from typing import Tuple, Optional
+import hashlib
+from functools import lru_cache
+from typing import Tuple, Optional, Union
 from .sodium_service import SodiumService
 
+@lru_cache(maxsize=8)
+def _derive_master_key(password_digest: bytes, salt: bytes, iterations: int) -> bytes:
+    """Derive a PBKDF2 master key, cached by password digest and salt"""
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=iterations
+    )
+    return kdf.derive(password_digest)
+
 class EncryptionService:
-    def __init__(self):
-        self._fernet_key = self._generate_fernet_key()
+    PBKDF2_ITERATIONS = 600_000
+
+    def __init__(
+        self,
+        fernet_key: Optional[Union[str, bytes]] = None,
+        ecc_private_key_pem: Optional[Union[str, bytes]] = None
+    ):
+        """Load configured key material, generating only what is missing"""
+        self._fernet_key = self._to_bytes(fernet_key) or self._generate_fernet_key()
         self._fernet = Fernet(self._fernet_key)
         self._sodium = SodiumService()
-        self.private_key, self.public_key = self._generate_ecc_keypair()
+        if ecc_private_key_pem:
+            self.private_key, self.public_key = self._load_ecc_keypair(
+                self._to_bytes(ecc_private_key_pem)
+            )
+        else:
+            self.private_key, self.public_key = self._generate_ecc_keypair()
+
+    @classmethod
+    def ephemeral(cls) -> "EncryptionService":
+        """Create a service with freshly generated, non-persisted key material"""
+        return cls()
+
+    @staticmethod
+    def _to_bytes(value: Optional[Union[str, bytes]]) -> Optional[bytes]:
+        """Normalize configured key material to bytes"""
+        if isinstance(value, str):
+            return value.encode()
+        return value
 
     def _generate_fernet_key(self) -> bytes:
         """Generate a Fernet key for AES-256 encryption"""
         return Fernet.generate_key()
 
-    def _generate_ecc_keypair(self) -> Tuple[ec.EllipticCurvePrivateKey, ec.EllipticCurvePublicKey]:
-        """Generate ECC key pair for asymmetric encryption"""
-        private_key = ec.generate_private_key(ec.SECP384R1())
+    def _generate_ecc_keypair(self) -> Tuple[x25519.X25519PrivateKey, x25519.X25519PublicKey]:
+        """Generate X25519 key pair for asymmetric encryption"""
+        private_key = x25519.X25519PrivateKey.generate()
         return private_key, private_key.public_key()
 
-    def encrypt_symmetric(self, data: str) -> str:
+    def _load_ecc_keypair(self, pem: bytes) -> Tuple[x25519.X25519PrivateKey, x25519.X25519PublicKey]:
+        """Load an X25519 key pair from a PEM encoded private key"""
+        private_key = serialization.load_pem_private_key(pem, password=None)
+        if not isinstance(private_key, x25519.X25519PrivateKey):
+            raise ValueError("ECC private key must be an X25519 key")
+        return private_key, private_key.public_key()
+
+    def encrypt_symmetric(self, data: Union[str, bytes]) -> str:
         """Encrypt data using AES-256"""
-        return self._fernet.encrypt(data.encode()).decode()
+        if isinstance(data, str):
+            data = data.encode()
+        # Fernet tokens are already URL-safe base64, so ASCII decoding is enough
+        return self._fernet.encrypt(data).decode('ascii')
 
-    def decrypt_symmetric(self, encrypted_data: str) -> str:
+    def decrypt_symmetric(self, encrypted_data: Union[str, bytes]) -> str:
         """Decrypt AES-256 encrypted data"""
-        return self._fernet.decrypt(encrypted_data.encode()).decode()
+        # Fernet accepts str tokens directly, avoiding an intermediate encode
+        return self._fernet.decrypt(encrypted_data).decode()
+
+    def _derive_master(self, password: bytes, salt: bytes) -> bytes:
+        """Derive a master key from a password with PBKDF2, once per password and salt"""
+        # Only the SHA-256 digest reaches the cache, so raw passwords are never retained
+        return _derive_master_key(
+            hashlib.sha256(password).digest(), salt, self.PBKDF2_ITERATIONS
+        )
+
+    def _password_fernet(self, password: bytes, salt: bytes, file_salt: bytes) -> Fernet:
+        """Build a Fernet from an HKDF subkey of the cached password master key"""
+        subkey = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=file_salt,
+            info=b"fernet-v1"
+        ).derive(self._derive_master(password, salt))
+        return Fernet(base64.urlsafe_b64encode(subkey))
+
+    def encrypt_with_password(self, data: Union[str, bytes], password: bytes, salt: bytes, file_salt: bytes) -> str:
+        """Encrypt data under a password-derived key, unique per file salt"""
+        if isinstance(data, str):
+            data = data.encode()
+        return self._password_fernet(password, salt, file_salt).encrypt(data).decode('ascii')
+
+    def decrypt_with_password(self, encrypted_data: Union[str, bytes], password: bytes, salt: bytes, file_salt: bytes) -> str:
+        """Decrypt data encrypted with encrypt_with_password"""
+        return self._password_fernet(password, salt, file_salt).decrypt(encrypted_data).decode()
 
     def encrypt_sodium(self, data: str) -> Tuple[str, str]:
         """Encrypt data using Libsodium"""
@@ -49,10 +125,10 @@ class EncryptionService:
         return self._sodium.asymmetric_decrypt(encrypted_data, sender_public_key)
 
     def serialize_public_key(self) -> str:
-        """Serialize public key for sharing"""
+        """Serialize the raw 32-byte public key for sharing"""
         return base64.b64encode(
             self.public_key.public_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PublicFormat.SubjectPublicKeyInfo
+                encoding=serialization.Encoding.Raw,
+                format=serialization.PublicFormat.Raw
             )
         ).decode()
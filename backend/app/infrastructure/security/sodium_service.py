@@ -1,16 +1,73 @@
+from collections import OrderedDict
+from threading import Lock
 from nacl.secret import SecretBox
 from nacl.public import PrivateKey, PublicKey, Box
 from nacl.utils import random
 import base64
+import hashlib
 from typing import Tuple, Optional, Union
 
 class SodiumService:
     """Service for handling encryption using Libsodium (PyNaCl)"""
 
+    MAX_CACHED_BOXES = 32
+
     def __init__(self):
         # Generate keypair for public-key encryption
         self._private_key = PrivateKey.generate()
         self.public_key = self._private_key.public_key
+        # LRU cache of SecretBox instances keyed by their raw session key
+        self._boxes: OrderedDict[bytes, SecretBox] = OrderedDict()
+        self._boxes_lock = Lock()
+        # SHA-256 digests of session keys retired through rotate_key
+        self._retired_keys: set[bytes] = set()
+
+    def _get_box(self, key: bytes) -> SecretBox:
+        """Return a cached SecretBox for the key, building it on first use"""
+        with self._boxes_lock:
+            if hashlib.sha256(key).digest() in self._retired_keys:
+                raise ValueError("Session key has been rotated out")
+            box = self._boxes.get(key)
+            if box is None:
+                box = self._boxes[key] = SecretBox(key)
+                if len(self._boxes) > self.MAX_CACHED_BOXES:
+                    self._boxes.popitem(last=False)
+            else:
+                self._boxes.move_to_end(key)
+            return box
+
+    def rotate_key(self, key: bytes) -> None:
+        """
+        Retire a session key so it can no longer encrypt or decrypt.
+
+        Its cached SecretBox is dropped and only a digest of the key is kept.
+
+        Args:
+            key: The raw session key to retire
+        """
+        with self._boxes_lock:
+            self._boxes.pop(key, None)
+            self._retired_keys.add(hashlib.sha256(key).digest())
+
+    def symmetric_encrypt_with_key(self, data: bytes, key: bytes) -> bytes:
+        """
+        Encrypt data with a caller-held session key, reusing its SecretBox
+
+        Args:
+            data: The raw bytes to encrypt
+            key: A SecretBox.KEY_SIZE byte session key
+        """
+        return self._get_box(key).encrypt(data)
+
+    def symmetric_decrypt_with_key(self, encrypted_data: bytes, key: bytes) -> bytes:
+        """
+        Decrypt data with a caller-held session key, reusing its SecretBox
+
+        Args:
+            encrypted_data: The raw encrypted bytes (nonce + ciphertext)
+            key: The session key used for encryption
+        """
+        return self._get_box(key).decrypt(encrypted_data)
 
     def symmetric_encrypt(self, data: str) -> Tuple[str, str]:
         """Encrypt data using Libsodium's SecretBox (XSalsa20-Poly1305)"""
@@ -24,6 +81,8 @@ class SodiumService:
 
     def symmetric_decrypt(self, encrypted_data: str, key: str) -> str:
         """Decrypt data using Libsodium's SecretBox"""
+        # Legacy keys are single-use, so build a throwaway box rather than
+        # filling the session-key cache with entries that are never reused
         box = SecretBox(base64.b64decode(key))
         decrypted = box.decrypt(base64.b64decode(encrypted_data))
         return decrypted.decode()
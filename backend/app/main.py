@@ -21,6 +21,10 @@ async def lifespan(app: FastAPI):
             "app.infrastructure.adapters.http.fastapi_controllers"
         ]
     )
+    # Resolve singletons once so request handlers read them from app.state
+    # instead of calling a provider on every request
+    app.state.submit_request_use_case = container.submit_request_use_case()
+    app.state.conversation_repository = container.conversation_repository()
     yield
     # Shutdown: Cleanup resources
     container.unwire()
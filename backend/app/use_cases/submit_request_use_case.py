@@ -1,15 +1,18 @@
-from typing import Any, Protocol
+from typing import Any, Dict, Protocol
 
 class GPTServicePort(Protocol):
     """Protocol for GPT service"""
-    def process_request(self, prompt: str) -> str:
+    def process_request(self, prompt: str) -> Dict[str, Any]:
+        """Return the completion as text, tokens_used and finish_reason"""
         ...
 
 class ConversationRepositoryPort(Protocol):
     """Protocol for conversation repository"""
-    def save_conversation(self, conversation_id: str, data: dict) -> None:
+    async def save_conversation(self, conversation_id: str, data: dict) -> None:
         ...
-    def get_conversation(self, conversation_id: str) -> dict:
+    async def get_conversation(self, conversation_id: str) -> dict:
+        ...
+    async def get_or_create(self, conversation_id: str) -> dict:
         ...
 
 class SubmitRequestUseCase:
@@ -18,6 +21,8 @@ class SubmitRequestUseCase:
 
     This class coordinates the process of sending prompts to GPT and saving responses.
     """
+    __slots__ = ("gpt_service", "conversation_repository")
+
     def __init__(
         self,
         gpt_service: GPTServicePort,
@@ -26,26 +31,23 @@ class SubmitRequestUseCase:
         self.gpt_service = gpt_service
         self.conversation_repository = conversation_repository
 
-    def execute(self, request_data: dict) -> dict:
+    async def execute(self, request_data: dict) -> dict:
         # Extract prompt from request data
         prompt = request_data.get("prompt", "")
         conversation_id = request_data.get("conversation_id", "default")
 
         # Process request through GPT service
-        response = self.gpt_service.process_request(prompt)
+        completion = self.gpt_service.process_request(prompt)
+        response = completion["text"]
 
         # Save to conversation history
-        conversation = self.conversation_repository.get_conversation(conversation_id) or {"id": conversation_id, "messages": []}
-        conversation["messages"].append({
-            "role": "user",
-            "content": prompt
-        })
-        conversation["messages"].append({
-            "role": "assistant",
-            "content": response
-        })
-
-        self.conversation_repository.save_conversation(conversation_id, conversation)
+        conversation = await self.conversation_repository.get_or_create(conversation_id)
+        conversation["messages"] += [
+            {"role": "user", "content": prompt},
+            {"role": "assistant", "content": response}
+        ]
+
+        await self.conversation_repository.save_conversation(conversation_id, conversation)
 
         # Return response
         return {
@@ -53,6 +55,8 @@ class SubmitRequestUseCase:
             "data": {
                 "prompt": prompt,
                 "response": response,
-                "conversation_id": conversation_id
+                "conversation_id": conversation_id,
+                "tokens_used": completion["tokens_used"],
+                "finish_reason": completion["finish_reason"]
             }
         }
@@ -4,7 +4,6 @@ Tests for the Cache Service in the application layer.
 
 import pytest
 from unittest.mock import Mock, patch
-import json
 import time
 from datetime import datetime, timedelta
 
@@ -48,6 +47,7 @@ class TestCacheService:
         assert result.key == key
         assert result.content == value
 
+    @pytest.mark.slow
     def test_CacheService_SetWithTTL_ExpiresCorrectly(self):
         # Arrange
         cache_adapter = InMemoryCacheAdapter()
@@ -129,6 +129,19 @@ class TestCacheService:
         # Assert
         assert key1 != key2  # Different data should produce different keys
 
+    def test_CacheService_GenerateKey_NonStringKeysIgnoreInsertionOrder(self):
+        # Arrange
+        cache_adapter = InMemoryCacheAdapter()
+        cache_service = CacheService(cache_adapter)
+        prefix = "test"
+
+        # Act
+        key1 = cache_service.generate_key(prefix, {1: "a", 2: "b"})
+        key2 = cache_service.generate_key(prefix, {2: "b", 1: "a"})
+
+        # Assert
+        assert key1 == key2  # Key order must not affect the generated key
+
     def test_CacheService_SetWithMetadata_IncludesMetadataInResponse(self):
         # Arrange
         cache_adapter = InMemoryCacheAdapter()
@@ -9,6 +9,8 @@ from app.application.ports.outbound.conversation_persistence_port import (
 from app.domain.models.gpt_request import GPTRequest
 from app.domain.models.gpt_response import GPTResponse
 
+_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+
 class MockConversationRepository(ConversationPersistencePort):
     def __init__(self):
         self.conversations: List[ConversationEntry] = []
@@ -28,14 +30,13 @@ class TestConversationPersistencePort:
     def port(self) -> MockConversationRepository:
         return MockConversationRepository()
 
-    @pytest.mark.asyncio
     async def test_save_conversation_entry(self, port: MockConversationRepository):
         # Arrange
         entry = ConversationEntry(
             user_id="test_user",
             request=GPTRequest(prompt="Test question?", max_tokens=100, user_id="test_user"),
             response=GPTResponse(text="Test answer", tokens_used=50, user_id="test_user", request_id="test_123"),
-            timestamp=datetime.now(UTC)
+            timestamp=_NOW
         )
 
         # Act
@@ -45,11 +46,10 @@ class TestConversationPersistencePort:
         assert len(port.conversations) == 1
         assert port.conversations[0] == entry
 
-    @pytest.mark.asyncio
     async def test_get_conversation_history(self, port: MockConversationRepository):
         # Arrange
         user_id = "test_user"
-        now = datetime.now(UTC)
+        now = _NOW
         entries = [
             ConversationEntry(
                 user_id=user_id,
@@ -0,0 +1,41 @@
+import pytest
+from unittest.mock import Mock
+from app.domain.conversation_repository import ConversationRepository
+from app.infrastructure.adapters.gpt.gpt_api_adapter import GPTAPIAdapter
+from app.use_cases.submit_request_use_case import SubmitRequestUseCase
+
+class TestConversationSubmitRequestUseCase:
+    @pytest.fixture
+    def repository(self):
+        return ConversationRepository()
+
+    @pytest.fixture
+    def use_case(self, repository):
+        gpt_service = Mock(spec=GPTAPIAdapter)
+        gpt_service.process_request.side_effect = lambda prompt: {
+            "text": f"reply to {prompt}",
+            "tokens_used": 7,
+            "finish_reason": "stop"
+        }
+        return SubmitRequestUseCase(gpt_service=gpt_service, conversation_repository=repository)
+
+    async def test_execute_appends_user_and_assistant_messages_in_order(self, use_case, repository):
+        # Act
+        await use_case.execute({"prompt": "first", "conversation_id": "conv"})
+        result = await use_case.execute({"prompt": "second", "conversation_id": "conv"})
+
+        # Assert
+        assert result["data"] == {
+            "prompt": "second",
+            "response": "reply to second",
+            "conversation_id": "conv",
+            "tokens_used": 7,
+            "finish_reason": "stop"
+        }
+        conversation = await repository.get_conversation("conv")
+        assert conversation["messages"] == [
+            {"role": "user", "content": "first"},
+            {"role": "assistant", "content": "reply to first"},
+            {"role": "user", "content": "second"},
+            {"role": "assistant", "content": "reply to second"}
+        ]
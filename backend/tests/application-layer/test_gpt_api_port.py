@@ -27,7 +27,6 @@ class TestGPTAPIPort:
     def port(self) -> MockGPTAPIAdapter:
         return MockGPTAPIAdapter()
 
-    @pytest.mark.asyncio
     async def test_generate_completion_success(self, port: MockGPTAPIAdapter):
         # Arrange
         api_request = GPTAPIRequest(
@@ -45,7 +44,6 @@ class TestGPTAPIPort:
         assert response.text == "Mocked API response"
         assert response.tokens_used == 50
 
-    @pytest.mark.asyncio
     async def test_generate_completion_handles_api_failure(self, port: MockGPTAPIAdapter):
         # Arrange
         port.should_fail = True
@@ -27,7 +27,6 @@ class TestGPTRequestPort:
     def port(self) -> MockGPTRequestUseCase:
         return MockGPTRequestUseCase()
 
-    @pytest.mark.asyncio
     async def test_submit_request_command_creates_valid_request(self, port: MockGPTRequestUseCase):
         # Arrange
         command = SubmitRequestCommand(
@@ -46,7 +45,6 @@ class TestGPTRequestPort:
         assert response.text == "Test response"
         assert response.tokens_used == 10
 
-    @pytest.mark.asyncio
     async def test_submit_request_command_invalid_params_raises_error(self, port: MockGPTRequestUseCase):
         """Test that invalid parameters raise appropriate validation errors"""
         # Test empty prompt
@@ -1,5 +1,4 @@
 import pytest
-from datetime import datetime, timedelta, UTC
 from app.application.use_cases.manage_session_lifecycle_use_case import (
     ManageSessionLifecycleUseCase,
     CreateSessionCommand,
@@ -7,32 +6,16 @@ from app.application.use_cases.manage_session_lifecycle_use_case import (
 )
 from app.domain.models.user_context import UserContext
 
-class MockSessionRepository:
-    def __init__(self):
-        self.sessions = {}
-        self.last_update = None
-
-    async def save_session(self, session: UserContext) -> None:
-        self.sessions[session.user_id] = session
-        self.last_update = datetime.now(UTC)
-
-    async def get_session(self, user_id: str) -> UserContext:
-        return self.sessions.get(user_id)
-
-    async def delete_session(self, user_id: str) -> None:
-        if user_id in self.sessions:
-            del self.sessions[user_id]
+_INITIAL_SESSION = UserContext(
+    user_id="test_user",
+    preferences={"language": "en", "model": "gpt-4"}
+)
 
 class TestManageSessionLifecycleUseCase:
-    @pytest.fixture
-    def session_repo(self):
-        return MockSessionRepository()
-
     @pytest.fixture
     def use_case(self, session_repo):
         return ManageSessionLifecycleUseCase(session_repo)
 
-    @pytest.mark.asyncio
     async def test_create_new_session(self, use_case, session_repo):
         # Arrange
         command = CreateSessionCommand(
@@ -46,16 +29,11 @@ class TestManageSessionLifecycleUseCase:
         # Assert
         assert session.user_id == "test_user"
         assert session.preferences == {"language": "en", "model": "gpt-4"}
-        assert session == session_repo.sessions["test_user"]
+        session_repo.save_session.assert_awaited_once_with(session)
 
-    @pytest.mark.asyncio
     async def test_update_existing_session(self, use_case, session_repo):
-        # Arrange - Create initial session
-        initial_session = UserContext(
-            user_id="test_user",
-            preferences={"language": "en", "model": "gpt-4"}
-        )
-        await session_repo.save_session(initial_session)
+        # Arrange - Existing session
+        session_repo.get_session.return_value = _INITIAL_SESSION
 
         # Update command
         command = UpdateSessionCommand(
@@ -68,19 +46,12 @@ class TestManageSessionLifecycleUseCase:
 
         # Assert
         assert updated_session.preferences["language"] == "es"
-        assert session_repo.last_update is not None
+        session_repo.get_session.assert_awaited_once_with("test_user")
+        session_repo.save_session.assert_awaited_once_with(updated_session)
 
-    @pytest.mark.asyncio
     async def test_end_session(self, use_case, session_repo):
-        # Arrange - Create session to end
-        session = UserContext(
-            user_id="test_user",
-            preferences={"language": "en"}
-        )
-        await session_repo.save_session(session)
-
         # Act
         await use_case.end_session("test_user")
 
         # Assert
-        assert "test_user" not in session_repo.sessions
+        session_repo.delete_session.assert_awaited_once_with("test_user")
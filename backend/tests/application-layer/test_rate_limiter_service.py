@@ -15,6 +15,29 @@ from app.infrastructure.adapters.rate_limiting.rate_limiter import (
 )
 
 
+@pytest.fixture(scope="module")
+def rate_limiter():
+    return InMemoryRateLimiter()
+
+
+@pytest.fixture
+def service(rate_limiter, request):
+    # Tests needing tighter limits pass an override via indirect parametrization;
+    # recorded usage is cleared so the shared limiter starts empty for every test
+    yield RateLimiterService(rate_limiter, limits_override=getattr(request, "param", None))
+    rate_limiter.clear()
+
+
+def api_limit(max_requests, window_seconds=60):
+    return {'api': {'max_requests': max_requests, 'window_seconds': window_seconds}}
+
+
+def use_quota(service, key, used, resource_type='api'):
+    # Record usage through the service so keys are built exactly as in production
+    for _ in range(used):
+        assert service.check_and_update(key, resource_type=resource_type).allowed is True
+
+
 class TestRateLimiterService:
     """
     Unit tests for the RateLimiterService.
@@ -22,50 +45,46 @@ class TestRateLimiterService:
     Following AAA pattern (Arrange, Act, Assert) for all tests.
     """
 
-    def test_RateLimiterService_CheckAndUpdate_WithinLimit_ReturnsAllowed(self):
+    @pytest.mark.parametrize("used", [0, 1, 5])
+    def test_RateLimiterService_QuotaAccounting_WithinLimit_TracksUsage(self, service, used):
         # Arrange
-        rate_limiter = InMemoryRateLimiter()
-        service = RateLimiterService(rate_limiter)
         key = "test_user"
+        max_requests = service.get_quota(key).max_requests
 
         # Act
-        result = service.check_and_update(key)
+        results = [service.check_and_update(key) for _ in range(used)]
+        quota = service.get_quota(key)
 
         # Assert
-        assert result.allowed is True
-        assert result.remaining == service._default_limits['api']['max_requests'] - 1
-
-    def test_RateLimiterService_CheckAndUpdate_DifferentResourceTypes_TrackedSeparately(self):
+        for count, result in enumerate(results, start=1):
+            assert result.allowed is True
+            assert result.remaining == max_requests - count
+        assert quota.used == used
+        assert quota.max_requests == max_requests
+        assert quota.remaining == max_requests - used
+
+    def test_RateLimiterService_CheckAndUpdate_DifferentResourceTypes_TrackedSeparately(self, service):
         # Arrange
-        rate_limiter = InMemoryRateLimiter()
-        service = RateLimiterService(rate_limiter)
         key = "test_user"
+        use_quota(service, key, 5, resource_type='api')
+        use_quota(service, key, 3, resource_type='gpt')
 
-        # Act - Use up some of the API quota
-        for i in range(5):
-            service.check_and_update(key, resource_type='api')
+        # Act - One more request against each quota
+        service.check_and_update(key, resource_type='api')
+        service.check_and_update(key, resource_type='gpt')
 
-        # Use up some of the GPT quota
-        for i in range(3):
-            service.check_and_update(key, resource_type='gpt')
-
-        # Get the current quotas
         api_quota = service.get_quota(key, resource_type='api')
         gpt_quota = service.get_quota(key, resource_type='gpt')
 
         # Assert
-        assert api_quota.used == 5
-        assert gpt_quota.used == 3
+        assert api_quota.used == 6
+        assert gpt_quota.used == 4
 
-    def test_RateLimiterService_CheckAndUpdate_ExceedsLimit_ReturnsDenied(self):
+    @pytest.mark.parametrize("service", [api_limit(3)], indirect=True)
+    def test_RateLimiterService_CheckAndUpdate_ExceedsLimit_ReturnsDenied(self, service):
         # Arrange
-        rate_limiter = InMemoryRateLimiter()
-        service = RateLimiterService(rate_limiter)
         key = "test_user"
 
-        # Set a very low limit for testing
-        service.update_limit_config('api', 3, 60)
-
         # Act - Use up the entire quota
         for i in range(3):
             service.check_and_update(key)
@@ -77,29 +96,8 @@ class TestRateLimiterService:
         assert result.allowed is False
         assert result.remaining == 0
 
-    def test_RateLimiterService_GetQuota_ReturnsCorrectValues(self):
+    def test_RateLimiterService_ResetLimit_ClearsUsage(self, service):
         # Arrange
-        rate_limiter = InMemoryRateLimiter()
-        service = RateLimiterService(rate_limiter)
-        key = "test_user"
-
-        # Use some of the quota
-        used_requests = 5
-        for i in range(used_requests):
-            service.check_and_update(key)
-
-        # Act
-        quota = service.get_quota(key)
-
-        # Assert
-        assert quota.used == used_requests
-        assert quota.max_requests == service._default_limits['api']['max_requests']
-        assert quota.remaining == service._default_limits['api']['max_requests'] - used_requests
-
-    def test_RateLimiterService_ResetLimit_ClearsUsage(self):
-        # Arrange
-        rate_limiter = InMemoryRateLimiter()
-        service = RateLimiterService(rate_limiter)
         key = "test_user"
 
         # Use some of the quota
@@ -112,12 +110,10 @@ class TestRateLimiterService:
 
         # Assert
         assert quota.used == 0
-        assert quota.remaining == service._default_limits['api']['max_requests']
+        assert quota.remaining == quota.max_requests
 
-    def test_RateLimiterService_UpdateLimitConfig_ChangesLimits(self):
+    def test_RateLimiterService_UpdateLimitConfig_ChangesLimits(self, service):
         # Arrange
-        rate_limiter = InMemoryRateLimiter()
-        service = RateLimiterService(rate_limiter)
         key = "test_user"
 
         # Set new limits
@@ -136,93 +132,36 @@ class TestRateLimiterService:
         assert quota.window_seconds == new_window
         assert result.remaining == new_max - 1
 
-    def test_RateLimiterService_WithRateLimiting_DecoratesFunction(self):
+    @pytest.mark.parametrize("service", [api_limit(1)], indirect=True)
+    @pytest.mark.parametrize(
+        "raise_on_limit,expected",
+        [(False, None), (True, RateLimitExceededError)]
+    )
+    def test_RateLimiterService_WithRateLimiting_LimitsDecoratedFunction(self, service, raise_on_limit, expected):
         # Arrange
-        rate_limiter = InMemoryRateLimiter()
-        service = RateLimiterService(rate_limiter)
-
-        # Define a test function and key extractor
         def test_func(user_id, data=None):
             return f"Success for {user_id}"
 
         def key_extractor(user_id, data=None):
             return user_id
 
-        # Act - Create a rate-limited function
-        limited_func = service.with_rate_limiting(
-            test_func,
-            key_extractor,
-            resource_type='api'
-        )
-
-        # Call the decorated function
-        result = limited_func("user123", {"test": "data"})
-
-        # Assert
-        assert result == "Success for user123"
-
-        # Verify rate limiting was applied
-        quota = service.get_quota("user123")
-        assert quota.used == 1
-
-    def test_RateLimiterService_WithRateLimiting_ExceedsLimit_ReturnsNone(self):
-        # Arrange
-        rate_limiter = InMemoryRateLimiter()
-        service = RateLimiterService(rate_limiter)
-        service.update_limit_config('api', 1, 60)  # Set limit to 1 request
-
-        # Define a test function and key extractor
-        def test_func(user_id):
-            return f"Success for {user_id}"
-
-        def key_extractor(user_id):
-            return user_id
-
-        # Act - Create a rate-limited function
-        limited_func = service.with_rate_limiting(
-            test_func,
-            key_extractor,
-            resource_type='api',
-            raise_on_limit=False
-        )
-
-        # Call the function once (should succeed)
-        first_result = limited_func("user123")
-
-        # Call it again (should be rate limited)
-        second_result = limited_func("user123")
-
-        # Assert
-        assert first_result == "Success for user123"
-        assert second_result is None
-
-    def test_RateLimiterService_WithRateLimiting_ExceedsLimit_RaisesException(self):
-        # Arrange
-        rate_limiter = InMemoryRateLimiter()
-        service = RateLimiterService(rate_limiter)
-        service.update_limit_config('api', 1, 60)  # Set limit to 1 request
-
-        # Define a test function and key extractor
-        def test_func(user_id):
-            return f"Success for {user_id}"
-
-        def key_extractor(user_id):
-            return user_id
-
-        # Act - Create a rate-limited function that raises exceptions
         limited_func = service.with_rate_limiting(
             test_func,
             key_extractor,
             resource_type='api',
-            raise_on_limit=True
+            raise_on_limit=raise_on_limit
         )
 
-        # Call the function once (should succeed)
-        first_result = limited_func("user123")
+        # Act - The first call fits in the quota
+        first_result = limited_func("user123", {"test": "data"})
 
         # Assert
         assert first_result == "Success for user123"
-
-        # Call it again (should raise exception)
-        with pytest.raises(RateLimitExceededError):
-            limited_func("user123")
+        assert service.get_quota("user123").used == 1
+
+        # The second call is over the limit
+        if raise_on_limit:
+            with pytest.raises(expected):
+                limited_func("user123")
+        else:
+            assert limited_func("user123") is expected
@@ -34,16 +34,26 @@ class TestSecurityService:
     Following AAA pattern (Arrange, Act, Assert) for all tests.
     """
 
-    @pytest.fixture
-    def mock_auth_service(self):
-        # Create a mock with stricter spec checking
+    @pytest.fixture(scope="session")
+    def _auth_spec(self):
+        # Build the autospec once; inspecting the class signature is the costly part
         return create_autospec(AuthenticationService, instance=True)
 
-    @pytest.fixture
-    def mock_authz_service(self):
-        # Create a mock with stricter spec checking
+    @pytest.fixture(scope="session")
+    def _authz_spec(self):
         return create_autospec(AuthorizationService, instance=True)
 
+    @pytest.fixture
+    def mock_auth_service(self, _auth_spec):
+        # Reuse the session autospec with a clean call history and configuration
+        _auth_spec.reset_mock(return_value=True, side_effect=True)
+        return _auth_spec
+
+    @pytest.fixture
+    def mock_authz_service(self, _authz_spec):
+        _authz_spec.reset_mock(return_value=True, side_effect=True)
+        return _authz_spec
+
     @pytest.fixture
     def security_service(self, mock_auth_service, mock_authz_service):
         return SecurityService(mock_auth_service, mock_authz_service)
@@ -170,11 +180,6 @@ class TestSecurityService:
             allowed_permissions=[Permission.READ]
         )
 
-        # Ensure mock methods don't return values
-        mock_authz_service.add_policy.return_value = None
-        mock_authz_service.update_policy.return_value = None
-        mock_authz_service.remove_policy.return_value = None
-
         # Act
         security_service.add_policy(policy)
         security_service.update_policy(policy)
@@ -185,7 +190,6 @@ class TestSecurityService:
         mock_authz_service.update_policy.assert_called_once_with(policy)
         mock_authz_service.remove_policy.assert_called_once_with(policy)
 
-    @pytest.mark.asyncio
     async def test_SecureEndpoint_Decorator_ValidTokenAndPermissions_CallsFunction(
         self,
         security_service,
@@ -216,7 +220,6 @@ class TestSecurityService:
             test_user, resource, permission
         )
 
-    @pytest.mark.asyncio
     async def test_SecureEndpoint_Decorator_InvalidToken_RaisesError(
         self,
         security_service,
@@ -237,7 +240,6 @@ class TestSecurityService:
         with pytest.raises(InvalidTokenError):
             await test_function(security_service=security_service, token=token)
 
-    @pytest.mark.asyncio
     async def test_SecureEndpoint_Decorator_UnauthorizedAccess_RaisesError(
         self,
         security_service,
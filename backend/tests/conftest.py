@@ -0,0 +1,101 @@
+"""
+Shared test doubles for the backend test suite.
+
+The mock ports below are built once per session and reset before each test
+that requests them, instead of being reinstantiated for every test method.
+
+The suite can be run in parallel with ``pytest -n auto --dist=loadfile``.
+Each xdist worker builds its own session fixtures, and loadfile keeps every
+test module on a single worker so module-scoped fixtures stay consistent.
+
+All async tests and fixtures share one session-wide event loop rather than
+each test creating and closing its own.
+"""
+
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from pytest_asyncio import is_async_test
+
+from app.application.ports.outbound.conversation_persistence_port import (
+    ConversationPersistencePort,
+)
+from app.application.ports.outbound.gpt_api_port import GPTAPIPort, GPTAPIRequest
+from app.application.use_cases.manage_session_lifecycle_use_case import (
+    SessionRepository,
+)
+from app.domain.models.gpt_response import GPTResponse
+from app.infrastructure.event_bus import EventBus
+
+_MOCKED_RESPONSE = GPTResponse(
+    text="Mocked response",
+    tokens_used=10,
+    user_id="test_user",
+    request_id="test_123"
+)
+
+
+def _mocked_completion(request: GPTAPIRequest) -> GPTResponse:
+    return _MOCKED_RESPONSE.model_copy(
+        update={"user_id": request.user_id, "request_id": str(uuid4())}
+    )
+
+
+def pytest_collection_modifyitems(items):
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+def _reset(mock):
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def reset_mock():
+    """Helper that clears a shared mock's calls, return values and side effects"""
+    return _reset
+
+
+@pytest.fixture(scope="session")
+def _gpt_api():
+    return AsyncMock(spec=GPTAPIPort)
+
+
+@pytest.fixture(scope="session")
+def _persistence():
+    return AsyncMock(spec=ConversationPersistencePort)
+
+
+@pytest.fixture(scope="session")
+def _session_repo():
+    return AsyncMock(spec=SessionRepository)
+
+
+@pytest.fixture(scope="session")
+def _event_tracker():
+    return Mock(spec=EventBus)
+
+
+@pytest.fixture
+def gpt_api(_gpt_api):
+    _reset(_gpt_api).generate_completion.side_effect = _mocked_completion
+    return _gpt_api
+
+
+@pytest.fixture
+def persistence(_persistence):
+    return _reset(_persistence)
+
+
+@pytest.fixture
+def session_repo(_session_repo):
+    return _reset(_session_repo)
+
+
+@pytest.fixture
+def event_tracker(_event_tracker):
+    return _reset(_event_tracker)
@@ -4,9 +4,17 @@ Tests for the CachedResponse domain model.
 
 import pytest
 from datetime import datetime, timedelta
-import time
+from freezegun import freeze_time
 from app.domain.models.cached_response import CachedResponse
 
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def clock():
+    with freeze_time(FROZEN_NOW, ignore=["_pytest.timing"]) as frozen:
+        yield frozen
+
 
 class TestCachedResponse:
     """
@@ -42,11 +50,7 @@ class TestCachedResponse:
         # Assert
         assert cached_response.key == key
         assert cached_response.content == content
-        assert cached_response.expires_at is not None
-        # Should expire approximately ttl_seconds in the future
-        expected_expiry = datetime.now() + timedelta(seconds=ttl_seconds)
-        # Allow for small timing differences (within 5 seconds)
-        assert abs((cached_response.expires_at - expected_expiry).total_seconds()) < 5
+        assert cached_response.expires_at == datetime(2024, 1, 1, 13, 0, 0)
 
     def test_CachedResponse_IsExpired_ReturnsFalseForNonExpired(self):
         # Arrange
@@ -61,7 +65,7 @@ class TestCachedResponse:
     def test_CachedResponse_IsExpired_ReturnsTrueForExpired(self):
         # Arrange
         # Create a response that's already expired by setting a past expiration time
-        now = datetime.now()
+        now = FROZEN_NOW
         expired_time = now - timedelta(seconds=10)  # 10 seconds in the past
 
         cached_response = CachedResponse(
@@ -78,17 +82,17 @@ class TestCachedResponse:
         # Assert
         assert is_expired is True
 
-    def test_CachedResponse_TimeToLive_ReturnsCorrectValue(self):
+    def test_CachedResponse_TimeToLive_ReturnsCorrectValue(self, clock):
         # Arrange
         ttl_seconds = 3600  # 1 hour
         cached_response = CachedResponse.create("test-key", "test-value", ttl_seconds=ttl_seconds)
+        clock.tick(600)
 
         # Act
         remaining_ttl = cached_response.time_to_live
 
         # Assert
-        # Should be close to the original ttl (allow for small timing differences)
-        assert abs(remaining_ttl - ttl_seconds) < 5
+        assert remaining_ttl == ttl_seconds - 600
 
     def test_CachedResponse_TimeToLive_ReturnsNoneForNoExpiration(self):
         # Arrange
@@ -103,7 +107,7 @@ class TestCachedResponse:
     def test_CachedResponse_TimeToLive_ReturnsZeroForExpired(self):
         # Arrange
         # Create a response that's already expired
-        now = datetime.now()
+        now = FROZEN_NOW
         cached_response = CachedResponse(
             key="test-key",
             content="test-value",
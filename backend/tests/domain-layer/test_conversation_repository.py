@@ -0,0 +1,27 @@
+import pytest
+from app.domain.conversation_repository import ConversationRepository
+
+class TestConversationRepository:
+    @pytest.fixture
+    def repository(self):
+        return ConversationRepository()
+
+    async def test_get_or_create_missing_conversation_creates_and_stores_it(self, repository):
+        # Act
+        conversation = await repository.get_or_create("new_conversation")
+
+        # Assert
+        assert conversation == {"id": "new_conversation", "messages": []}
+        assert await repository.get_conversation("new_conversation") is conversation
+
+    async def test_get_or_create_existing_conversation_returns_it_unchanged(self, repository):
+        # Arrange
+        existing = {"id": "existing", "messages": [{"role": "user", "content": "hi"}]}
+        await repository.save_conversation("existing", existing)
+
+        # Act
+        conversation = await repository.get_or_create("existing")
+
+        # Assert
+        assert conversation is existing
+        assert conversation["messages"] == [{"role": "user", "content": "hi"}]
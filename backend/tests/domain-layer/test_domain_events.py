@@ -7,6 +7,25 @@ from app.domain.events.error_events import ErrorOccurredEvent
 from app.domain.models.gpt_request import GPTRequest
 from app.domain.models.gpt_response import GPTResponse
 
+@pytest.fixture(scope="module")
+def sample_request():
+    return GPTRequest(prompt="Test prompt", max_tokens=100, user_id="test_user")
+
+@pytest.fixture(scope="module")
+def sample_response(sample_request):
+    return GPTResponse(
+        text="Test response",
+        tokens_used=50,
+        user_id="test_user",
+        request_id=sample_request.request_id
+    )
+
+EVENT_CASES = [
+    (RequestInitiatedEvent, ("request",), "request_initiated"),
+    (RequestCompletedEvent, ("request", "response"), "request_completed"),
+    (ResponseReceivedEvent, ("response",), "response_received"),
+]
+
 class TestDomainEvents:
     def test_base_event_properties(self):
         # Arrange
@@ -22,53 +41,21 @@ class TestDomainEvents:
         assert isinstance(event.timestamp, datetime)
         assert event.event_id is not None
 
-    def test_request_initiated_event(self):
+    @pytest.mark.parametrize("event_cls,fields,expected_type", EVENT_CASES)
+    def test_request_response_events(self, sample_request, sample_response, event_cls, fields, expected_type):
         # Arrange
-        request = GPTRequest(prompt="Test prompt", max_tokens=100, user_id="test_user")
+        models = {"request": sample_request, "response": sample_response}
+        kwargs = {field: models[field] for field in fields}
 
         # Act
-        event = RequestInitiatedEvent(request=request)
+        event = event_cls(**kwargs)
 
         # Assert
-        assert event.event_type == "request_initiated"
-        assert event.data["request"] == request
+        assert event.event_type == expected_type
+        for field, value in kwargs.items():
+            assert event.data[field] == value
         assert "timestamp" in event.data
 
-    def test_request_completed_event(self):
-        # Arrange
-        request = GPTRequest(prompt="Test prompt", max_tokens=100, user_id="test_user")
-        response = GPTResponse(
-            text="Test response",
-            tokens_used=50,
-            user_id="test_user",
-            request_id=request.request_id
-        )
-
-        # Act
-        event = RequestCompletedEvent(request=request, response=response)
-
-        # Assert
-        assert event.event_type == "request_completed"
-        assert event.data["request"] == request
-        assert event.data["response"] == response
-
-    def test_response_received_event(self):
-        # Arrange
-        request = GPTRequest(prompt="Test prompt", max_tokens=100, user_id="test_user")
-        response = GPTResponse(
-            text="Test response",
-            tokens_used=50,
-            user_id="test_user",
-            request_id=request.request_id
-        )
-
-        # Act
-        event = ResponseReceivedEvent(response=response)
-
-        # Assert
-        assert event.event_type == "response_received"
-        assert event.data["response"] == response
-
     def test_error_occurred_event(self):
         # Arrange
         error = ValueError("Test error")
@@ -25,19 +25,15 @@ class TestGPTRequest:
         assert request.request_id is not None  # Should auto-generate an ID
         assert request.timestamp is not None  # Should set current time
 
-    def test_gpt_request_validation_errors(self):
+    @pytest.mark.parametrize("kwargs", [
+        {"user_id": "user123", "prompt": "", "temperature": 0.7},  # Empty prompt
+        {"user_id": "user123", "prompt": "Hello", "temperature": 2.0},  # Temperature outside valid range
+        {"user_id": "user123", "prompt": "Hello", "max_tokens": -10},  # Negative max_tokens
+    ], ids=["empty_prompt", "temperature_out_of_range", "negative_max_tokens"])
+    def test_gpt_request_validation_errors(self, kwargs):
         """Test validation errors when creating GPTRequest with invalid data"""
         with pytest.raises(ValueError):
-            # Test empty prompt
-            GPTRequest(user_id="user123", prompt="", temperature=0.7)
-
-        with pytest.raises(ValueError):
-            # Test invalid temperature (outside valid range)
-            GPTRequest(user_id="user123", prompt="Hello", temperature=2.0)
-
-        with pytest.raises(ValueError):
-            # Test invalid max_tokens (negative)
-            GPTRequest(user_id="user123", prompt="Hello", max_tokens=-10)
+            GPTRequest(**kwargs)
 
     def test_gpt_request_default_values(self):
         """Test default values are set correctly when not provided"""
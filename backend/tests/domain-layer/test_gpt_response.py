@@ -22,15 +22,14 @@ class TestGPTResponse:
         assert response.response_id is not None  # Should auto-generate an ID
         assert response.timestamp is not None  # Should set current time
 
-    def test_gpt_response_validation_errors(self):
+    @pytest.mark.parametrize("kwargs", [
+        {"user_id": "user123", "request_id": "req456", "text": "", "tokens_used": 42},  # Empty text
+        {"user_id": "user123", "request_id": "req456", "text": "Some text", "tokens_used": -5},  # Negative tokens_used
+    ], ids=["empty_text", "negative_tokens_used"])
+    def test_gpt_response_validation_errors(self, kwargs):
         """Test validation errors when creating GPTResponse with invalid data"""
         with pytest.raises(ValueError):
-            # Test empty text
-            GPTResponse(user_id="user123", request_id="req456", text="", tokens_used=42)
-
-        with pytest.raises(ValueError):
-            # Test invalid tokens_used (negative)
-            GPTResponse(user_id="user123", request_id="req456", text="Some text", tokens_used=-5)
+            GPTResponse(**kwargs)
 
     def test_gpt_response_default_values(self):
         """Test default values are set correctly when not provided"""
@@ -2,12 +2,15 @@ import pytest
 from app.domain.services.prompt_formatter import PromptFormatter
 
 class TestPromptFormatter:
-    def test_basic_formatting(self):
+    @pytest.fixture(scope="class")
+    def default_formatter(self):
+        return PromptFormatter()
+
+    def test_basic_formatting(self, default_formatter):
         """Test basic prompt formatting without context"""
-        formatter = PromptFormatter()
         input_prompt = "  test prompt  "
         expected = "test prompt"
-        assert formatter.format_prompt(input_prompt) == expected
+        assert default_formatter.format_prompt(input_prompt) == expected
 
     def test_formatting_with_user_context(self):
         """Test formatting with user context and conversation history"""
@@ -33,8 +36,7 @@ class TestPromptFormatter:
         input_prompt = "this is a very long prompt"
         assert len(formatter.format_prompt(input_prompt)) <= 10
 
-    def test_formatting_with_few_shot_examples(self):
+    def test_formatting_with_few_shot_examples(self, default_formatter):
         """Test formatting with few-shot examples"""
-        formatter = PromptFormatter()
         input_prompt = "test prompt"
-        assert formatter.format_prompt(input_prompt) == "test prompt"
+        assert default_formatter.format_prompt(input_prompt) == "test prompt"
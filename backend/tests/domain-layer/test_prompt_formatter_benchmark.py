@@ -0,0 +1,32 @@
+"""
+Benchmarks for prompt formatting.
+
+Disabled by default via --benchmark-disable in the pytest config. Run with:
+
+    pytest tests/domain-layer/test_prompt_formatter_benchmark.py \
+        --benchmark-enable --benchmark-only --benchmark-json=benchmark-results.json
+"""
+
+from app.domain.services.prompt_formatter import PromptFormatter
+from app.domain.services.prompt_service import PromptService
+
+class TestPromptFormattingBenchmark:
+    def test_prompt_formatter_format_prompt(self, benchmark):
+        """Benchmark template substitution in PromptFormatter"""
+        formatter = PromptFormatter(template="Q: {prompt}\nA:")
+        result = benchmark(formatter.format_prompt, "hello world")
+        assert result == "Q: hello world\nA:"
+
+    def test_prompt_formatter_truncation(self, benchmark):
+        """Benchmark truncation of prompts longer than max_length"""
+        formatter = PromptFormatter(max_length=100)
+        result = benchmark(formatter.format_prompt, "x" * 10_000)
+        assert len(result) == 100
+
+    def test_prompt_service_format_prompt(self, benchmark):
+        """Benchmark context substitution in PromptService"""
+        service = PromptService()
+        template = "You are a {role}. Help {user} with {task}."
+        context = {"role": "helpful assistant", "user": "John", "task": "writing code"}
+        result = benchmark(service.format_prompt, template, context)
+        assert result == "You are a helpful assistant. Help John with writing code."
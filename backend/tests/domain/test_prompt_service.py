@@ -4,9 +4,12 @@ from app.domain.services.prompt_service import PromptService
 from app.domain.models.gpt_request import GPTRequest
 
 class TestPromptService:
-    def test_format_prompt_with_template(self):
+    @pytest.fixture(scope="class")
+    def prompt_service(self):
+        return PromptService()
+
+    def test_format_prompt_with_template(self, prompt_service):
         # Arrange
-        prompt_service = PromptService()
         template = "You are a {role}. Help {user} with {task}."
         context: Dict[str, str] = {
             "role": "helpful assistant",
@@ -21,9 +24,8 @@ class TestPromptService:
         expected = "You are a helpful assistant. Help John with writing code."
         assert formatted_prompt == expected
 
-    def test_format_prompt_with_missing_context(self):
+    def test_format_prompt_with_missing_context(self, prompt_service):
         # Arrange
-        prompt_service = PromptService()
         template = "You are a {role}. Help with {task}."
         context: Dict[str, str] = {
             "role": "helpful assistant"
@@ -34,9 +36,8 @@ class TestPromptService:
             prompt_service.format_prompt(template, context)
         assert "task" in str(exc_info.value)
 
-    def test_validate_prompt_length(self):
+    def test_validate_prompt_length(self, prompt_service):
         # Arrange
-        prompt_service = PromptService()
         max_length = 10
         prompt = "This is a very long prompt that exceeds the maximum length"
 
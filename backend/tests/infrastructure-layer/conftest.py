@@ -1,45 +1,55 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
-import asyncio
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
-from dependency_injector import containers, providers
-from app.infrastructure.container import Container
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, patch
 from app.domain.models.gpt_response import GPTResponse
-from app.domain.models.gpt_request import GPTRequest
+
+@pytest.fixture(scope="session")
+def _gpt_service():
+    return AsyncMock()
+
+@pytest.fixture(scope="session")
+def _conversation_repo():
+    return AsyncMock()
+
+@pytest.fixture(scope="session")
+def _submit_use_case():
+    return AsyncMock()
+
+@pytest.fixture(scope="session")
+def _session_use_case():
+    return AsyncMock()
 
 @pytest.fixture
-def mock_gpt_service():
+def mock_gpt_service(_gpt_service, reset_mock):
     """Create a mock GPT service"""
-    mock = AsyncMock()
-    mock.generate_completion = AsyncMock(return_value=GPTResponse(
+    mock = reset_mock(_gpt_service)
+    mock.generate_completion.return_value = GPTResponse.model_construct(
         text="This is a test response",
         tokens_used=10,
         finish_reason="stop",
         user_id="test_user",
         request_id="test_request"
-    ))
+    )
     return mock
 
 @pytest.fixture
-def mock_conversation_repo():
+def mock_conversation_repo(_conversation_repo, reset_mock):
     """Create a mock conversation repository"""
-    mock = AsyncMock()
-    mock.save_conversation = AsyncMock()
-    mock.get_conversation = AsyncMock(return_value={
+    mock = reset_mock(_conversation_repo)
+    mock.get_conversation.return_value = {
         "id": "default",
         "messages": [
             {"role": "user", "content": "test prompt"},
             {"role": "assistant", "content": "test response"}
         ]
-    })
-    mock.create_session = AsyncMock(return_value={
+    }
+    mock.create_session.return_value = {
         "id": "test-session-1",
         "created_at": "2024-01-01T00:00:00Z",
         "user_id": "test_user",
         "messages": []
-    })
-    mock.get_conversations_by_user = AsyncMock(return_value=[
+    }
+    mock.get_conversations_by_user.return_value = [
         {
             "id": "test_convo",
             "messages": [
@@ -47,77 +57,85 @@ def mock_conversation_repo():
                 {"role": "assistant", "content": "test response"}
             ]
         }
-    ])
+    ]
     return mock
 
 @pytest.fixture
-def mock_submit_use_case():
+def mock_submit_use_case(_submit_use_case, reset_mock):
     """Create a mock submit request use case"""
-    mock = AsyncMock()
-    mock.submit_request = AsyncMock(return_value=GPTResponse(
+    mock = reset_mock(_submit_use_case)
+    mock.submit_request.return_value = GPTResponse.model_construct(
         text="Test response for prompt",
         tokens_used=42,
         finish_reason="stop",
         user_id="test_user",
         request_id="test-123"
-    ))
-    mock.execute = AsyncMock(return_value={
+    )
+    mock.execute.return_value = {
         "data": {
             "response": "Test response for prompt",
             "tokens_used": 42,
             "finish_reason": "stop"
         }
-    })
+    }
     return mock
 
 @pytest.fixture
-def mock_session_use_case():
+def mock_session_use_case(_session_use_case, reset_mock):
     """Create a mock session lifecycle use case"""
-    mock = AsyncMock()
-    mock.create_session = AsyncMock(return_value={
+    mock = reset_mock(_session_use_case)
+    mock.create_session.return_value = {
         "session_id": "test-session-1",
         "user_id": "test_user"
-    })
+    }
     return mock
 
 class TestContainer:
     """Test container that provides mock dependencies through static methods."""
     _instance = None
-    _mocks = {}
+    _MOCK_NAMES = ('gpt_service', 'gpt_api', 'conversation_repository', 'submit_use_case', 'session_use_case')
+    _gpt_service = None
+    _gpt_api = None
+    _conversation_repository = None
+    _submit_use_case = None
+    _session_use_case = None
 
     @classmethod
     def set_mocks(cls, mocks):
         """Set mock instances that will be returned by provider methods"""
-        cls._mocks = mocks
+        cls.reset()
+        for name, mock in mocks.items():
+            setattr(cls, f"_{name}", mock)
 
     @classmethod
     def reset(cls):
         """Reset all mocks"""
-        cls._mocks = {}
+        for name in cls._MOCK_NAMES:
+            setattr(cls, f"_{name}", None)
 
     @classmethod
     def gpt_service(cls):
-        return cls._mocks.get('gpt_service')
+        return cls._gpt_service
 
     @classmethod
     def gpt_api(cls):
-        return cls._mocks.get('gpt_api')
+        return cls._gpt_api
 
     @classmethod
     def conversation_repository(cls):
-        return cls._mocks.get('conversation_repository')
+        return cls._conversation_repository
 
     @classmethod
     def submit_use_case(cls):
-        return cls._mocks.get('submit_use_case')
+        return cls._submit_use_case
 
     @classmethod
     def submit_request_use_case(cls):
-        return cls._mocks.get('submit_use_case')
+        return cls._submit_use_case
 
     @classmethod
     def session_use_case(cls):
-        return cls._mocks.get('session_use_case')
+        return cls._session_use_case
 
     @classmethod
     def wire(cls, modules):
@@ -143,29 +161,29 @@ def mock_container(mock_conversation_repo, mock_gpt_service, mock_submit_use_cas
 
     return TestContainer
 
-@pytest.fixture
-def test_client(mock_container):
-    """Create a FastAPI test client with mocked dependencies"""
+@pytest.fixture(scope="session")
+def _app_client():
+    """Start the FastAPI app once per session with container references patched"""
+    from fastapi.testclient import TestClient
     from app.main import app
 
-    # Patch all container references to use our TestContainer
-    patches = [
-        patch('app.main.Container', mock_container),
-        patch('app.infrastructure.adapters.http.graphql_schema.Container', mock_container),
-        patch('app.infrastructure.adapters.http.fastapi_controllers.Container', mock_container)
-    ]
+    # Only the lifespan's container is patched; GraphQL tests patch the schema's own
+    with ExitStack() as stack:
+        stack.enter_context(patch('app.main.container', TestContainer))
 
-    # Start all patches
-    for p in patches:
-        p.start()
+        # Create test client; the lifespan handler runs once here
+        yield stack.enter_context(TestClient(app))
 
-    # Create test client
-    with TestClient(app) as client:
-        yield client
+@pytest.fixture
+def test_client(_app_client, mock_container):
+    """Create a FastAPI test client with mocked dependencies"""
+    # The lifespan resolved app.state before this test's mocks existed,
+    # so point it at the current ones
+    state = _app_client.app.state
+    state.submit_request_use_case = mock_container.submit_request_use_case()
+    state.conversation_repository = mock_container.conversation_repository()
 
-    # Stop all patches
-    for p in patches:
-        p.stop()
+    yield _app_client
 
     # Reset container
     mock_container.reset()
@@ -173,19 +191,7 @@ def test_client(mock_container):
 @pytest.fixture
 def mock_schema_container(mock_container):
     """Create a container specifically for GraphQL schema tests"""
-    from app.infrastructure.adapters.http.graphql_schema import schema
-
-    # Update schema's container references
-    patches = [
-        patch('app.infrastructure.adapters.http.graphql_schema.Container', mock_container)
-    ]
-
-    # Start all patches
-    for p in patches:
-        p.start()
-
-    yield mock_container
+    from app.infrastructure.adapters.http import graphql_schema
 
-    # Stop all patches
-    for p in patches:
-        p.stop()
+    with patch.object(graphql_schema, 'Container', mock_container):
+        yield mock_container
@@ -22,6 +22,25 @@ from app.infrastructure.adapters.security.authentication import (
 )
 
 
+SECRET_KEY = "test_secret_key"
+
+
+@pytest.fixture(scope="module")
+def jwt_service():
+    return JWTAuthenticationService(secret_key=SECRET_KEY)
+
+
+@pytest.fixture(scope="module")
+def canonical_user():
+    return User(id="user123", username="testuser", email="test@example.com", role=UserRole.USER)
+
+
+@pytest.fixture(scope="module")
+def valid_token(jwt_service, canonical_user):
+    # Signed once per module; tests that exercise token creation still call generate_token themselves
+    return jwt_service.generate_token(canonical_user)
+
+
 class TestJWTAuthenticationService:
     """
     Tests for the JWT-based authentication service implementation.
@@ -29,24 +48,17 @@ class TestJWTAuthenticationService:
     Following AAA pattern (Arrange, Act, Assert) for all tests.
     """
 
-    def test_JWTAuthService_GenerateToken_WithValidUser_ReturnsValidJWT(self):
+    def test_JWTAuthService_GenerateToken_WithValidUser_ReturnsValidJWT(self, jwt_service, canonical_user):
         # Arrange
-        secret_key = "test_secret_key"
-        auth_service = JWTAuthenticationService(secret_key=secret_key)
-        user = User(
-            id="user123",
-            username="testuser",
-            email="test@example.com",
-            role=UserRole.USER
-        )
+        user = canonical_user
 
         # Act
-        token = auth_service.generate_token(user)
+        token = jwt_service.generate_token(user)
 
         # Assert
         assert token is not None
         # Verify we can decode the token with the same secret
-        decoded = jwt.decode(token, secret_key, algorithms=["HS256"])
+        decoded = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
         assert decoded["sub"] == user.id
         assert decoded["username"] == user.username
         assert decoded["email"] == user.email
@@ -54,31 +66,25 @@ class TestJWTAuthenticationService:
         assert "exp" in decoded  # Should have expiration
         assert "iat" in decoded  # Should have issued at time
 
-    def test_JWTAuthService_GenerateToken_WithCustomExpiry_SetsCorrectExpiration(self):
+    def test_JWTAuthService_GenerateToken_WithCustomExpiry_SetsCorrectExpiration(self, jwt_service, canonical_user):
         # Arrange
-        secret_key = "test_secret_key"
-        auth_service = JWTAuthenticationService(secret_key=secret_key)
-        user = User(id="user123", username="testuser", email="test@example.com", role=UserRole.USER)
         expiry_minutes = 60  # 1 hour
 
         # Act
-        token = auth_service.generate_token(user, expiry_minutes=expiry_minutes)
+        token = jwt_service.generate_token(canonical_user, expiry_minutes=expiry_minutes)
 
         # Assert
-        decoded = jwt.decode(token, secret_key, algorithms=["HS256"])
+        decoded = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
         # Check that expiration time is ~60 minutes in the future (allow for small timing differences)
         expected_exp = int(time.time()) + expiry_minutes * 60
         assert abs(decoded["exp"] - expected_exp) < 5  # Within 5 seconds
 
-    def test_JWTAuthService_ValidateToken_WithValidToken_ReturnsUser(self):
+    def test_JWTAuthService_ValidateToken_WithValidToken_ReturnsUser(self, jwt_service, canonical_user, valid_token):
         # Arrange
-        secret_key = "test_secret_key"
-        auth_service = JWTAuthenticationService(secret_key=secret_key)
-        original_user = User(id="user123", username="testuser", email="test@example.com", role=UserRole.USER)
-        token = auth_service.generate_token(original_user)
+        original_user = canonical_user
 
         # Act
-        validated_user = auth_service.validate_token(token)
+        validated_user = jwt_service.validate_token(valid_token)
 
         # Assert
         assert validated_user is not None
@@ -87,11 +93,9 @@ class TestJWTAuthenticationService:
         assert validated_user.email == original_user.email
         assert validated_user.role == original_user.role
 
-    def test_JWTAuthService_ValidateToken_WithExpiredToken_RaisesExpiredTokenError(self):
+    def test_JWTAuthService_ValidateToken_WithExpiredToken_RaisesExpiredTokenError(self, jwt_service, canonical_user):
         # Arrange
-        secret_key = "test_secret_key"
-        auth_service = JWTAuthenticationService(secret_key=secret_key)
-        user = User(id="user123", username="testuser", email="test@example.com", role=UserRole.USER)
+        auth_service, user = jwt_service, canonical_user
 
         # Create a token that is already expired
         with patch("time.time") as mock_time:
@@ -103,55 +107,33 @@ class TestJWTAuthenticationService:
         with pytest.raises(ExpiredTokenError):
             auth_service.validate_token(token)
 
-    def test_JWTAuthService_ValidateToken_WithInvalidToken_RaisesInvalidTokenError(self):
+    @pytest.mark.parametrize("mutate_token,secret_key", [
+        (lambda token: "invalid.jwt.token", SECRET_KEY),
+        (lambda token: token[:-1] + ("A" if token[-1] != "A" else "B"), SECRET_KEY),
+        (lambda token: token, "wrong_secret_key"),
+    ], ids=["malformed", "tampered", "wrong_secret"])
+    def test_JWTAuthService_ValidateToken_WithBadToken_RaisesInvalidTokenError(
+        self,
+        jwt_service,
+        valid_token,
+        mutate_token,
+        secret_key
+    ):
         # Arrange
-        secret_key = "test_secret_key"
-        auth_service = JWTAuthenticationService(secret_key=secret_key)
-        invalid_token = "invalid.jwt.token"
+        auth_service = jwt_service if secret_key == SECRET_KEY else JWTAuthenticationService(secret_key=secret_key)
+        token = mutate_token(valid_token)
 
         # Act & Assert
         with pytest.raises(InvalidTokenError):
-            auth_service.validate_token(invalid_token)
-
-    def test_JWTAuthService_ValidateToken_WithTamperedToken_RaisesInvalidTokenError(self):
-        # Arrange
-        secret_key = "test_secret_key"
-        auth_service = JWTAuthenticationService(secret_key=secret_key)
-        user = User(id="user123", username="testuser", email="test@example.com", role=UserRole.USER)
-        valid_token = auth_service.generate_token(user)
-
-        # Create a tampered token by changing one character
-        tampered_token = valid_token[:-1] + ("A" if valid_token[-1] != "A" else "B")
-
-        # Act & Assert
-        with pytest.raises(InvalidTokenError):
-            auth_service.validate_token(tampered_token)
-
-    def test_JWTAuthService_ValidateToken_WithWrongSecretKey_RaisesInvalidTokenError(self):
-        # Arrange
-        secret_key = "test_secret_key"
-        wrong_secret = "wrong_secret_key"
-
-        # Create token with original secret
-        auth_service = JWTAuthenticationService(secret_key=secret_key)
-        user = User(id="user123", username="testuser", email="test@example.com", role=UserRole.USER)
-        token = auth_service.generate_token(user)
-
-        # Try to validate with different secret
-        wrong_auth_service = JWTAuthenticationService(secret_key=wrong_secret)
-
-        # Act & Assert
-        with pytest.raises(InvalidTokenError):
-            wrong_auth_service.validate_token(token)
+            auth_service.validate_token(token)
 
-    def test_JWTAuthService_RefreshToken_WithValidToken_ReturnsNewToken(self):
+    def test_JWTAuthService_RefreshToken_WithValidToken_ReturnsNewToken(self, jwt_service, canonical_user):
         """
         Test that a valid refresh token returns a new token with updated issue time and expiry,
         while maintaining the same user claims. Time control is achieved via freezegun.
         """
-        secret_key = "test_secret_key"
-        auth_service = JWTAuthenticationService(secret_key=secret_key)
-        user = User(id="user123", username="testuser", email="test@example.com", role=UserRole.USER)
+        secret_key = SECRET_KEY
+        auth_service, user = jwt_service, canonical_user
 
         # Freeze time at the initial time for token generation
         initial_time = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
@@ -169,11 +151,11 @@ class TestJWTAuthenticationService:
             "verify_exp": False,
             "verify_iat": False,
         }
+        # The original token was signed by this test, so only its claims are read back
         original_payload = jwt.decode(
             original_token,
-            secret_key,
             algorithms=["HS256"],
-            options=decode_options
+            options={**decode_options, "verify_signature": False}
         )
         new_payload = jwt.decode(
             new_token,
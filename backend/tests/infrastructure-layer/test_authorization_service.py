@@ -7,6 +7,7 @@ following the AAA pattern (Arrange, Act, Assert).
 
 import pytest
 from datetime import datetime
+from functools import lru_cache
 
 from app.domain.models.user import User, UserRole, UserStatus
 from app.infrastructure.adapters.security.authorization import (
@@ -18,6 +19,27 @@ from app.infrastructure.adapters.security.authorization import (
 )
 
 
+@pytest.fixture(scope="module")
+def standard_user():
+    return User(id="user123", username="user", email="user@example.com", role=UserRole.USER)
+
+
+@pytest.fixture(scope="module")
+def admin_user():
+    return User(id="admin123", username="admin", email="admin@example.com", role=UserRole.ADMIN)
+
+
+@pytest.fixture(scope="module")
+def inactive_admin_user():
+    return User(
+        id="user123",
+        username="user",
+        email="user@example.com",
+        role=UserRole.ADMIN,
+        status=UserStatus.INACTIVE
+    )
+
+
 class TestRBACAuthorizationService:
     """
     Tests for the RBAC-based authorization service implementation.
@@ -25,15 +47,29 @@ class TestRBACAuthorizationService:
     Following AAA pattern (Arrange, Act, Assert) for all tests.
     """
 
-    def test_RBACAuth_CheckAccess_AdminUserHasAccess_ReturnsTrue(self):
+    @pytest.fixture(scope="class")
+    def auth_service_factory(self):
+        """
+        Build services from (resource, roles, permissions) policy tuples.
+
+        Services are cached per policy set, so only tests that mutate
+        policies should construct their own RBACAuthorizationService.
+        """
+        @lru_cache(maxsize=None)
+        def build(policies=()):
+            service = RBACAuthorizationService()
+            for resource, roles, permissions in policies:
+                service.add_policy(ResourcePolicy(
+                    resource=resource,
+                    allowed_roles=list(roles),
+                    allowed_permissions=list(permissions)
+                ))
+            return service
+        return build
+
+    def test_RBACAuth_CheckAccess_AdminUserHasAccess_ReturnsTrue(self, auth_service_factory, admin_user):
         # Arrange
-        auth_service = RBACAuthorizationService()
-        admin_user = User(
-            id="admin123",
-            username="admin",
-            email="admin@example.com",
-            role=UserRole.ADMIN
-        )
+        auth_service = auth_service_factory()
         resource = "sensitive_data"
         permission = Permission.READ
 
@@ -43,25 +79,16 @@ class TestRBACAuthorizationService:
         # Assert
         assert result is True
 
-    def test_RBACAuth_CheckAccess_StandardUserWithPermission_ReturnsTrue(self):
+    def test_RBACAuth_CheckAccess_StandardUserWithPermission_ReturnsTrue(self, auth_service_factory, standard_user):
         # Arrange
-        auth_service = RBACAuthorizationService()
-        user = User(
-            id="user123",
-            username="user",
-            email="user@example.com",
-            role=UserRole.USER
-        )
+        user = standard_user
         resource = "public_data"
         permission = Permission.READ
 
-        # Add a policy that allows users to read public data
-        policy = ResourcePolicy(
-            resource="public_data",
-            allowed_roles=[UserRole.USER, UserRole.ADMIN],
-            allowed_permissions=[Permission.READ]
-        )
-        auth_service.add_policy(policy)
+        # Policy that allows users to read public data
+        auth_service = auth_service_factory((
+            ("public_data", (UserRole.USER, UserRole.ADMIN), (Permission.READ,)),
+        ))
 
         # Act
         result = auth_service.check_access(user, resource, permission)
@@ -69,25 +96,16 @@ class TestRBACAuthorizationService:
         # Assert
         assert result is True
 
-    def test_RBACAuth_CheckAccess_StandardUserWithoutPermission_ReturnsFalse(self):
+    def test_RBACAuth_CheckAccess_StandardUserWithoutPermission_ReturnsFalse(self, auth_service_factory, standard_user):
         # Arrange
-        auth_service = RBACAuthorizationService()
-        user = User(
-            id="user123",
-            username="user",
-            email="user@example.com",
-            role=UserRole.USER
-        )
+        user = standard_user
         resource = "sensitive_data"
         permission = Permission.WRITE
 
-        # Add a policy that only allows admins to write sensitive data
-        policy = ResourcePolicy(
-            resource="sensitive_data",
-            allowed_roles=[UserRole.ADMIN],
-            allowed_permissions=[Permission.WRITE]
-        )
-        auth_service.add_policy(policy)
+        # Policy that only allows admins to write sensitive data
+        auth_service = auth_service_factory((
+            ("sensitive_data", (UserRole.ADMIN,), (Permission.WRITE,)),
+        ))
 
         # Act
         result = auth_service.check_access(user, resource, permission)
@@ -95,40 +113,25 @@ class TestRBACAuthorizationService:
         # Assert
         assert result is False
 
-    def test_RBACAuth_EnforceAccess_UnauthorizedUser_RaisesException(self):
+    def test_RBACAuth_EnforceAccess_UnauthorizedUser_RaisesException(self, auth_service_factory, standard_user):
         # Arrange
-        auth_service = RBACAuthorizationService()
-        user = User(
-            id="user123",
-            username="user",
-            email="user@example.com",
-            role=UserRole.USER
-        )
+        user = standard_user
         resource = "sensitive_data"
         permission = Permission.WRITE
 
-        # Add a policy that only allows admins to write sensitive data
-        policy = ResourcePolicy(
-            resource="sensitive_data",
-            allowed_roles=[UserRole.ADMIN],
-            allowed_permissions=[Permission.WRITE]
-        )
-        auth_service.add_policy(policy)
+        # Policy that only allows admins to write sensitive data
+        auth_service = auth_service_factory((
+            ("sensitive_data", (UserRole.ADMIN,), (Permission.WRITE,)),
+        ))
 
         # Act & Assert
         with pytest.raises(UnauthorizedError):
             auth_service.enforce_access(user, resource, permission)
 
-    def test_RBACAuth_CheckAccess_InactiveUser_ReturnsFalse(self):
+    def test_RBACAuth_CheckAccess_InactiveUser_ReturnsFalse(self, auth_service_factory, inactive_admin_user):
         # Arrange
-        auth_service = RBACAuthorizationService()
-        user = User(
-            id="user123",
-            username="user",
-            email="user@example.com",
-            role=UserRole.ADMIN,
-            status=UserStatus.INACTIVE
-        )
+        auth_service = auth_service_factory()
+        user = inactive_admin_user
         resource = "any_resource"
         permission = Permission.READ
 
@@ -138,25 +141,16 @@ class TestRBACAuthorizationService:
         # Assert
         assert result is False
 
-    def test_RBACAuth_CheckAccess_MultiplePermissions_ChecksAll(self):
+    def test_RBACAuth_CheckAccess_MultiplePermissions_ChecksAll(self, auth_service_factory, standard_user):
         # Arrange
-        auth_service = RBACAuthorizationService()
-        user = User(
-            id="user123",
-            username="user",
-            email="user@example.com",
-            role=UserRole.USER
-        )
+        user = standard_user
         resource = "document"
         permissions = [Permission.READ, Permission.WRITE]
 
-        # Add a policy that allows users to read and write documents
-        policy = ResourcePolicy(
-            resource="document",
-            allowed_roles=[UserRole.USER],
-            allowed_permissions=[Permission.READ, Permission.WRITE]
-        )
-        auth_service.add_policy(policy)
+        # Policy that allows users to read and write documents
+        auth_service = auth_service_factory((
+            ("document", (UserRole.USER,), (Permission.READ, Permission.WRITE)),
+        ))
 
         # Act
         result = auth_service.check_access(user, resource, permissions)
@@ -164,15 +158,10 @@ class TestRBACAuthorizationService:
         # Assert
         assert result is True
 
-    def test_RBACAuth_RemovePolicy_PolicyRemoved_ReturnsFalse(self):
+    def test_RBACAuth_RemovePolicy_PolicyRemoved_ReturnsFalse(self, standard_user):
         # Arrange
         auth_service = RBACAuthorizationService()
-        user = User(
-            id="user123",
-            username="user",
-            email="user@example.com",
-            role=UserRole.USER
-        )
+        user = standard_user
         resource = "temp_resource"
         permission = Permission.READ
 
@@ -195,15 +184,10 @@ class TestRBACAuthorizationService:
         assert initial_access is True
         assert result is False
 
-    def test_RBACAuth_UpdatePolicy_PolicyUpdated_ReflectsChanges(self):
+    def test_RBACAuth_UpdatePolicy_PolicyUpdated_ReflectsChanges(self, standard_user):
         # Arrange
         auth_service = RBACAuthorizationService()
-        user = User(
-            id="user123",
-            username="user",
-            email="user@example.com",
-            role=UserRole.USER
-        )
+        user = standard_user
         resource = "dynamic_resource"
         permission = Permission.WRITE
 
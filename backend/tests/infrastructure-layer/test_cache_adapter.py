@@ -1,7 +1,8 @@
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock
-import time
+import msgpack
+from freezegun import freeze_time
 
 # Import the interfaces and implementations that will be created
 from app.infrastructure.adapters.cache.cache_adapter import CacheAdapter, InMemoryCacheAdapter, RedisCacheAdapter
@@ -42,13 +43,14 @@ class TestCacheAdapter:
         cache = InMemoryCacheAdapter()
         key = "expiring_key"
         value = {"data": "will_expire"}
-        ttl_seconds = 0.1  # 100ms for quick testing
+        ttl_seconds = 60
 
         # Act
-        cache.set(key, value, ttl_seconds=ttl_seconds)
-        result_before_expiry = cache.get(key)
-        time.sleep(ttl_seconds * 2)  # Wait until after expiration
-        result_after_expiry = cache.get(key)
+        with freeze_time("2024-01-01 12:00:00") as frozen:
+            cache.set(key, value, ttl_seconds=ttl_seconds)
+            result_before_expiry = cache.get(key)
+            frozen.tick(ttl_seconds * 2)  # Move past expiration
+            result_after_expiry = cache.get(key)
 
         # Assert
         assert result_before_expiry == value
@@ -98,16 +100,15 @@ class TestCacheAdapter:
         cache.set(key, value)
         result = cache.get(key)
 
-        # Assert
-        assert result == value
-        assert type(result) == type(value)
+        # Assert - The in-memory cache stores by reference, so the exact object comes back
+        assert result is value
 
     # Redis Cache Adapter tests would be more complex and might require mocking
     # This is a simplified test with mocks
     def test_RedisCache_SetGet_ReturnsStoredValue(self):
         # Arrange
         mock_redis_client = Mock()
-        mock_redis_client.get.return_value = b'{"data": "test_value"}'
+        mock_redis_client.get.return_value = msgpack.packb({"data": "test_value"}, use_bin_type=True)
         cache = RedisCacheAdapter(redis_client=mock_redis_client)
         key = "test_key"
         value = {"data": "test_value"}
@@ -118,5 +119,35 @@ class TestCacheAdapter:
 
         # Assert
         mock_redis_client.set.assert_called_once()
-        mock_redis_client.get.assert_called_once()
+        mock_redis_client.get.assert_called_once_with(f"{RedisCacheAdapter.KEY_PREFIX}{key}")
         assert result == value
+
+    def test_RedisCache_SetWithTTL_StoresMessagePackPayload(self):
+        # Arrange
+        mock_redis_client = Mock()
+        cache = RedisCacheAdapter(redis_client=mock_redis_client)
+        key = "test_key"
+        value = {"content": "test_value", "metadata": {"source": "test"}}
+
+        # Act
+        cache.set(key, value, ttl_seconds=60)
+
+        # Assert
+        mock_redis_client.setex.assert_called_once()
+        stored_key, ttl, payload = mock_redis_client.setex.call_args.args
+        assert stored_key == f"{RedisCacheAdapter.KEY_PREFIX}{key}"
+        assert ttl == 60
+        assert msgpack.unpackb(payload, raw=False) == value
+
+    def test_RedisCache_GetUndecodablePayload_ReturnsNone(self, caplog):
+        # Arrange
+        mock_redis_client = Mock()
+        mock_redis_client.get.return_value = b"\xc1"  # reserved, never valid MessagePack
+        cache = RedisCacheAdapter(redis_client=mock_redis_client)
+
+        # Act
+        result = cache.get("test_key")
+
+        # Assert
+        assert result is None
+        assert "test_key" in caplog.text
@@ -0,0 +1,25 @@
+from app.application.use_cases.process_response_use_case import ProcessResponseUseCase
+from app.domain.conversation_repository import (
+    ConversationRepository as DomainConversationRepository,
+)
+from app.infrastructure.adapters.persistence.repository_impl import ConversationRepository
+from app.infrastructure.container import Container
+
+def test_process_use_case_is_wired_to_persistence():
+    # Arrange
+    container = Container()
+
+    # Act
+    use_case = container.process_use_case()
+
+    # Assert
+    assert isinstance(use_case, ProcessResponseUseCase)
+    assert isinstance(container.persistence(), ConversationRepository)
+    assert use_case.persistence is container.persistence()
+
+def test_conversation_repository_uses_domain_repository():
+    # Act
+    repository = Container().conversation_repository()
+
+    # Assert
+    assert isinstance(repository, DomainConversationRepository)
@@ -1,10 +1,13 @@
+import base64
 import pytest
-from app.infrastructure.security.encryption import EncryptionService
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import serialization
+from app.infrastructure.security.encryption import EncryptionService, _derive_master_key
 
 class TestEncryptionService:
     @pytest.fixture
     def encryption_service(self):
-        return EncryptionService()
+        return EncryptionService.ephemeral()
 
     def test_symmetric_encryption(self, encryption_service):
         # Arrange
@@ -18,6 +21,35 @@ class TestEncryptionService:
         assert decrypted == original_data
         assert encrypted != original_data
 
+    def test_symmetric_encryption_accepts_bytes(self, encryption_service):
+        # Arrange
+        original_data = b"sensitive data"
+
+        # Act
+        encrypted = encryption_service.encrypt_symmetric(original_data)
+        decrypted = encryption_service.decrypt_symmetric(encrypted.encode())
+
+        # Assert
+        assert isinstance(encrypted, str)
+        assert decrypted == original_data.decode()
+
+    def test_password_encryption_derives_master_key_once(self, encryption_service):
+        # Arrange
+        encryption_service.PBKDF2_ITERATIONS = 1_000
+        password, salt = b"correct horse", b"0123456789abcdef"
+        _derive_master_key.cache_clear()
+
+        # Act
+        first = encryption_service.encrypt_with_password("first", password, salt, b"file-1")
+        second = encryption_service.encrypt_with_password("second", password, salt, b"file-2")
+
+        # Assert
+        assert _derive_master_key.cache_info().misses == 1
+        assert encryption_service.decrypt_with_password(first, password, salt, b"file-1") == "first"
+        assert encryption_service.decrypt_with_password(second, password, salt, b"file-2") == "second"
+        with pytest.raises(InvalidToken):
+            encryption_service.decrypt_with_password(first, password, salt, b"file-2")
+
     def test_sodium_encryption(self, encryption_service):
         # Arrange
         original_data = "sensitive data"
@@ -36,7 +68,7 @@ class TestEncryptionService:
 
         # Assert
         assert isinstance(serialized_key, str)
-        assert len(serialized_key) > 0
+        assert len(base64.b64decode(serialized_key)) == 32
 
     def test_invalid_decrypt_raises_error(self, encryption_service):
         # Arrange
@@ -45,3 +77,21 @@ class TestEncryptionService:
         # Assert
         with pytest.raises(Exception):
             encryption_service.decrypt_symmetric(invalid_data)
+
+    def test_configured_keys_are_reused(self, encryption_service):
+        # Arrange
+        fernet_key = Fernet.generate_key()
+        private_pem = encryption_service.private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+        first = EncryptionService(fernet_key=fernet_key, ecc_private_key_pem=private_pem)
+        second = EncryptionService(fernet_key=fernet_key.decode(), ecc_private_key_pem=private_pem)
+
+        # Act
+        encrypted = first.encrypt_symmetric("sensitive data")
+
+        # Assert
+        assert second.decrypt_symmetric(encrypted) == "sensitive data"
+        assert second.serialize_public_key() == encryption_service.serialize_public_key()
@@ -1,35 +1,68 @@
 import pytest
-import json
 from typing import Dict, Any
+from unittest.mock import patch
+from app.infrastructure.adapters.http import graphql_schema
+from app.infrastructure.container import Container
 from app.infrastructure.adapters.http.graphql_schema import schema
 from app.domain.models.gpt_request import GPTRequest
 from app.domain.models.gpt_response import GPTResponse
 
+# Operation documents are shared module constants so the schema's parser and
+# validation caches are hit on every repeat execution
+SUBMIT_GPT_REQUEST_MUTATION = """
+    mutation($request: GPTRequestInput!) {
+        submitGptRequest(request: $request) {
+            text
+            tokensUsed
+            finishReason
+        }
+    }
+"""
+
+CONVERSATION_HISTORY_QUERY = """
+    query($conversationId: String!) {
+        conversationHistory(conversationId: $conversationId) {
+            id
+            messages {
+                role
+                content
+            }
+        }
+    }
+"""
+
+CREATE_SESSION_MUTATION = """
+    mutation($sessionInput: SessionInput!) {
+        createSession(sessionInput: $sessionInput) {
+            id
+            messages {
+                role
+                content
+            }
+        }
+    }
+"""
+
 @pytest.fixture
+def real_container():
+    """Resolve schema dependencies from the real container, with no mocks"""
+    with patch.object(graphql_schema, "Container", Container):
+        yield Container
+
+@pytest.fixture(scope="module")
 def client():
-    # Using schema directly for testing
+    # Using the module-level schema directly; it is compiled once at import
     return schema
 
 class TestGraphQLResolvers:
-    @pytest.mark.asyncio
     async def test_submit_prompt_mutation(self, client, mock_schema_container, mock_submit_use_case):
         # Arrange
         prompt = "test prompt"
         user_id = "test_user"
 
         # Act
-        mutation = """
-            mutation($request: GPTRequestInput!) {
-                submitGptRequest(request: $request) {
-                    text
-                    tokensUsed
-                    finishReason
-                }
-            }
-        """
-
         result = await client.execute(
-            mutation,
+            SUBMIT_GPT_REQUEST_MUTATION,
             variable_values={"request": {"prompt": prompt, "userId": user_id}}
         )
 
@@ -40,7 +73,6 @@ class TestGraphQLResolvers:
         assert "text" in result.data["submitGptRequest"]
         assert "tokensUsed" in result.data["submitGptRequest"]
 
-    @pytest.mark.asyncio
     async def test_get_conversation_history_query(self, client, mock_schema_container, mock_conversation_repo):
         # Arrange
         conversation_id = "test_conversation"
@@ -55,20 +87,8 @@ class TestGraphQLResolvers:
         }
 
         # Act
-        query = """
-            query($conversationId: String!) {
-                conversationHistory(conversationId: $conversationId) {
-                    id
-                    messages {
-                        role
-                        content
-                    }
-                }
-            }
-        """
-
         result = await client.execute(
-            query,
+            CONVERSATION_HISTORY_QUERY,
             variable_values={"conversationId": conversation_id}
         )
 
@@ -79,7 +99,6 @@ class TestGraphQLResolvers:
         assert "id" in result.data["conversationHistory"]
         assert "messages" in result.data["conversationHistory"]
 
-    @pytest.mark.asyncio
     async def test_create_session_mutation(self, client, mock_schema_container, mock_conversation_repo):
         # Arrange
         user_id = "test_user"
@@ -94,20 +113,8 @@ class TestGraphQLResolvers:
         }
 
         # Act
-        mutation = """
-            mutation($sessionInput: SessionInput!) {
-                createSession(sessionInput: $sessionInput) {
-                    id
-                    messages {
-                        role
-                        content
-                    }
-                }
-            }
-        """
-
         result = await client.execute(
-            mutation,
+            CREATE_SESSION_MUTATION,
             variable_values={"sessionInput": {"userId": user_id, "name": name}}
         )
 
@@ -118,7 +125,6 @@ class TestGraphQLResolvers:
         assert "id" in result.data["createSession"]
         assert "messages" in result.data["createSession"]
 
-@pytest.mark.asyncio
 async def test_conversation_history_query(mock_schema_container, mock_conversation_repo):
     # Arrange
     user_id = "test_user"
@@ -140,19 +146,10 @@ async def test_conversation_history_query(mock_schema_container, mock_conversati
     }
 
     # Act
-    query = """
-        query {
-            conversationHistory(conversationId: "default") {
-                id
-                messages {
-                    role
-                    content
-                }
-            }
-        }
-    """
-
-    result = await schema.execute(query)
+    result = await schema.execute(
+        CONVERSATION_HISTORY_QUERY,
+        variable_values={"conversationId": "default"}
+    )
 
     # Assert
     assert result.errors is None or len(result.errors) == 0
@@ -162,25 +159,14 @@ async def test_conversation_history_query(mock_schema_container, mock_conversati
     assert result.data["conversationHistory"]["messages"][0]["role"] == "user"
     assert result.data["conversationHistory"]["messages"][0]["content"] == test_request.prompt
 
-@pytest.mark.asyncio
 async def test_submit_gpt_request_mutation(mock_schema_container, mock_submit_use_case):
     # Arrange
     test_prompt = "test prompt"
     test_user_id = "test_user"
 
     # Act
-    mutation = """
-        mutation($request: GPTRequestInput!) {
-            submitGptRequest(request: $request) {
-                text
-                tokensUsed
-                finishReason
-            }
-        }
-    """
-
     result = await schema.execute(
-        mutation,
+        SUBMIT_GPT_REQUEST_MUTATION,
         variable_values={
             "request": {
                 "prompt": test_prompt,
@@ -195,3 +181,33 @@ async def test_submit_gpt_request_mutation(mock_schema_container, mock_submit_us
     assert "submitGptRequest" in result.data
     assert "text" in result.data["submitGptRequest"]
     assert "tokensUsed" in result.data["submitGptRequest"]
+
+async def test_submit_gpt_request_with_real_container(real_container):
+    # Act
+    result = await schema.execute(
+        SUBMIT_GPT_REQUEST_MUTATION,
+        variable_values={"request": {"prompt": "test prompt", "userId": "test_user"}}
+    )
+
+    # Assert
+    assert result.errors is None, result.errors
+    assert result.data["submitGptRequest"]["text"] == "This is a stub response to: test prompt"
+    assert result.data["submitGptRequest"]["tokensUsed"] > 0
+    assert result.data["submitGptRequest"]["finishReason"] == "stop"
+
+async def test_create_session_and_query_history_with_real_container(real_container):
+    # Act
+    created = await schema.execute(
+        CREATE_SESSION_MUTATION,
+        variable_values={"sessionInput": {"userId": "graphql_smoke_user"}}
+    )
+    session_id = created.data["createSession"]["id"]
+    history = await schema.execute(
+        CONVERSATION_HISTORY_QUERY,
+        variable_values={"conversationId": session_id}
+    )
+
+    # Assert
+    assert created.errors is None, created.errors
+    assert history.errors is None, history.errors
+    assert history.data["conversationHistory"] == {"id": session_id, "messages": []}
@@ -58,6 +58,7 @@ class TestRateLimiter:
         assert result.allowed is False
         assert result.remaining == 0
 
+    @pytest.mark.slow
     def test_InMemoryRateLimiter_CheckLimit_WindowExpires_ResetsCounter(self):
         # Arrange
         rate_limiter = InMemoryRateLimiter()
@@ -118,6 +119,19 @@ class TestRateLimiter:
         assert quota.used == 0
         assert quota.remaining == max_requests
 
+    def test_InMemoryRateLimiter_Clear_ClearsUsageForAllKeys(self):
+        # Arrange
+        rate_limiter = InMemoryRateLimiter()
+        rate_limiter.check_limit("user_a", 5, 60)
+        rate_limiter.check_limit("user_b", 10, 30)
+
+        # Act
+        rate_limiter.clear()
+
+        # Assert
+        assert rate_limiter.get_quota("user_a", 5, 60).used == 0
+        assert rate_limiter.get_quota("user_b", 10, 30).used == 0
+
     def test_InMemoryRateLimiter_MultipleKeys_TrackSeparately(self):
         # Arrange
         rate_limiter = InMemoryRateLimiter()
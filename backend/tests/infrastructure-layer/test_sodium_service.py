@@ -1,6 +1,8 @@
 import pytest
 from nacl.public import PrivateKey, Box
 import base64
+from nacl.secret import SecretBox
+from nacl.utils import random
 from app.infrastructure.security.sodium_service import SodiumService
 
 class TestSodiumService:
@@ -45,3 +47,41 @@ class TestSodiumService:
         # Assert
         assert encrypted != original_data
         assert decrypted == original_data
+
+    def test_symmetric_decrypt_with_single_use_key_round_trips_repeatedly(self, sodium_service):
+        # Arrange
+        encrypted, key = sodium_service.symmetric_encrypt("sensitive data")
+
+        # Act
+        first = sodium_service.symmetric_decrypt(encrypted, key)
+        second = sodium_service.symmetric_decrypt(encrypted, key)
+
+        # Assert
+        assert first == second == "sensitive data"
+
+    def test_symmetric_encryption_with_session_key_round_trips(self, sodium_service):
+        # Arrange
+        key = random(SecretBox.KEY_SIZE)
+
+        # Act
+        first = sodium_service.symmetric_encrypt_with_key(b"first", key)
+        second = sodium_service.symmetric_encrypt_with_key(b"second", key)
+
+        # Assert
+        assert first != second
+        assert sodium_service.symmetric_decrypt_with_key(first, key) == b"first"
+        assert sodium_service.symmetric_decrypt_with_key(second, key) == b"second"
+
+    def test_rotate_key_makes_old_ciphertext_undecryptable(self, sodium_service):
+        # Arrange
+        key = random(SecretBox.KEY_SIZE)
+        encrypted = sodium_service.symmetric_encrypt_with_key(b"data", key)
+
+        # Act
+        sodium_service.rotate_key(key)
+
+        # Assert
+        with pytest.raises(ValueError):
+            sodium_service.symmetric_decrypt_with_key(encrypted, key)
+        with pytest.raises(ValueError):
+            sodium_service.symmetric_encrypt_with_key(b"more data", key)